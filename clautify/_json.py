@@ -0,0 +1,24 @@
+"""Compact JSON encoding/decoding, backed by orjson when the "fast" extra is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["dumps", "loads"]
+
+# Spotify does not need the whitespace stdlib json puts after separators
+_SEPARATORS = (",", ":")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=_SEPARATORS)
+
+
+loads = orjson.loads if orjson is not None else json.loads
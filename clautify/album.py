@@ -5,9 +5,9 @@ from typing import Any
 
 from clautify.client import BaseClient
 from clautify.exceptions import AlbumError
-from clautify.http.request import TLSClient
+from clautify.http.request import TLSClient, new_default_client
 from clautify.types.annotations import enforce
-from clautify.utils.pagination import paginate
+from clautify.utils.pagination import paginate_concurrent
 from clautify.utils.strings import extract_spotify_id
 
 __all__ = ["PublicAlbum", "AlbumError"]
@@ -21,13 +21,14 @@ class PublicAlbum:
     Parameters
     ----------
     album (str): The Spotify URI of the album.
-    client (TLSClient): An instance of TLSClient to use for requests.
+    client (Optional[TLSClient]): An instance of TLSClient to use for requests. Defaults to an anonymous shared one.
     """
 
     __slots__ = (
         "base",
         "album_id",
         "album_link",
+        "album_uri",
     )
 
     def __init__(
@@ -35,12 +36,13 @@ class PublicAlbum:
         album: str,
         /,
         *,
-        client: TLSClient = TLSClient("chrome_120", "", auto_retries=3),
+        client: TLSClient | None = None,
         language: str = "en",
     ) -> None:
-        self.base = BaseClient(client=client, language=language)
+        self.base = BaseClient(client=client or new_default_client(), language=language)
         self.album_id = extract_spotify_id(album, "album")
         self.album_link = f"https://open.spotify.com/album/{self.album_id}"
+        self.album_uri = f"spotify:album:{self.album_id}"
 
     def get_album_info(self, limit: int = 25, *, offset: int = 0) -> Mapping[str, Any]:
         """Gets the public public information"""
@@ -49,7 +51,7 @@ class PublicAlbum:
             "getAlbum",
             {
                 "locale": "",
-                "uri": f"spotify:album:{self.album_id}",
+                "uri": self.album_uri,
                 "offset": offset,
                 "limit": limit,
             },
@@ -66,9 +68,10 @@ class PublicAlbum:
 
     def paginate_album(self) -> Generator[Mapping[str, Any], None, None]:
         """Generator that fetches album tracks in chunks."""
-        return paginate(
+        return paginate_concurrent(
             lambda limit, offset: self.get_album_info(limit=limit, offset=offset),
             "data.albumUnion.tracksV2.totalCount",
             "data.albumUnion.tracksV2.items",
             upper_limit=343,
+            key="getAlbum",
         )
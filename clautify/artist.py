@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from collections.abc import Generator, Mapping
-from typing import Any, Literal
+from typing import Any, List, Literal
 
 from clautify.client import BaseClient
 from clautify.exceptions import ArtistError
-from clautify.http.request import TLSClient
+from clautify.http.request import TLSClient, new_default_client
 from clautify.login import Login
 from clautify.types.annotations import enforce
-from clautify.utils.pagination import paginate
+from clautify.utils.pagination import paginate_concurrent
 from clautify.utils.strings import extract_spotify_id
 
 __all__ = ["Artist", "ArtistError"]
@@ -38,14 +38,16 @@ class Artist:
         self,
         login: Login | None = None,
         *,
-        client: TLSClient = TLSClient("chrome_120", "", auto_retries=3),
+        client: TLSClient | None = None,
         language: str = "en",
     ) -> None:
         if login and not login.logged_in:
             raise ValueError("Must be logged in")
 
         self._login: bool = bool(login)
-        self.base = BaseClient(client=login.client if (login is not None) else client, language=language)
+        self.base = BaseClient(
+            client=login.client if (login is not None) else (client or new_default_client()), language=language
+        )
 
     def query_artists(self, query: str, /, limit: int = 10, *, offset: int = 0) -> Mapping[str, Any]:
         """Searches for an artist in the Spotify catalog"""
@@ -95,16 +97,17 @@ class Artist:
 
     def paginate_artists(self, query: str, /) -> Generator[Mapping[str, Any], None, None]:
         """Generator that fetches artists in chunks."""
-        return paginate(
+        return paginate_concurrent(
             lambda limit, offset: self.query_artists(query, limit=limit, offset=offset),
             "data.searchV2.artists.totalCount",
             "data.searchV2.artists.items",
             upper_limit=100,
+            key="searchArtists",
         )
 
     def _do_follow(
         self,
-        artist_id: str,
+        artist_ids: List[str],
         /,
         *,
         action: Literal["addToLibrary", "removeFromLibrary"] = "addToLibrary",
@@ -112,15 +115,11 @@ class Artist:
         if not self._login:
             raise ValueError("Must be logged in")
 
-        artist_id = extract_spotify_id(artist_id, "artist")
+        # The library mutations take a list of URIs, so any number of artists costs one request
+        uris = [f"spotify:artist:{extract_spotify_id(artist_id, 'artist')}" for artist_id in artist_ids]
 
         url = "https://api-partner.spotify.com/pathfinder/v1/query"
-        payload = self.base.graphql_payload(
-            action,
-            {
-                "uris": [f"spotify:artist:{artist_id}"],
-            },
-        )
+        payload = self.base.graphql_payload(action, {"uris": uris})
         resp = self.base.client.post(url, json=payload, authenticate=True)
 
         if resp.fail:
@@ -128,8 +127,16 @@ class Artist:
 
     def follow(self, artist_id: str, /) -> None:
         """Follow an artist"""
-        return self._do_follow(artist_id)
+        return self._do_follow([artist_id])
 
     def unfollow(self, artist_id: str, /) -> None:
         """Unfollow an artist"""
-        return self._do_follow(artist_id, action="removeFromLibrary")
+        return self._do_follow([artist_id], action="removeFromLibrary")
+
+    def follow_many(self, artist_ids: List[str], /) -> None:
+        """Follow several artists in a single request"""
+        return self._do_follow(artist_ids)
+
+    def unfollow_many(self, artist_ids: List[str], /) -> None:
+        """Unfollow several artists in a single request"""
+        return self._do_follow(artist_ids, action="removeFromLibrary")
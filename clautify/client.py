@@ -1,13 +1,22 @@
-import atexit
 import base64
+import functools
+import hashlib
+import itertools
 import json
+import operator
+import os
+import re
+import threading
 import time
 from collections.abc import Mapping
-from typing import Literal, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Tuple
 
-import pyotp
-import requests
+from tls_client import Session
+from tls_client.exceptions import TLSClientExeption
 
+from clautify._json import dumps
 from clautify.exceptions import BaseClientError
 from clautify.http.request import TLSClient
 from clautify.types.alias import _Undefined, _UStr
@@ -23,11 +32,24 @@ _FALLBACK_SECRET: Tuple[Literal[18], bytearray] = (
     bytearray([70, 60, 33, 57, 92, 120, 90, 33, 32, 62, 62, 55, 126, 93, 66, 35, 108, 68]),
 )
 
+# XOR mask applied to the secret before encoding; it repeats every 33 bytes
+_TOTP_MASK = bytes((t % 33) + 9 for t in range(33))
+
 # Cache storage for TOTP
 _secret_cache: Tuple[int, bytearray] | None = None
 _cache_expiry: float = -1
 _CACHE_TTL = 15 * 60
 
+# On-disk cache for data that outlives a process (persisted-query hashes, auth tokens)
+_CACHE_DIR = Path.home() / ".cache" / "clautify"
+_HASH_RE = re.compile(r'"(\w+)","(?:query|mutation)","([0-9a-f]{64})"')
+# Hash files of other client versions unused for this long are removed (seconds)
+_HASH_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+_APP_CFG_RE = re.compile(r'<script id="appServerConfig" type="text/plain">([^<]+)</script>')
+
+# Max parallel downloads of the web player's JS sub-chunks
+_CHUNK_FETCH_WORKERS = 16
+
 __all__ = ["BaseClient", "BaseClientError"]
 
 
@@ -37,6 +59,8 @@ def get_latest_totp_secret() -> Tuple[int, bytearray]:
     if _secret_cache and time.time() < _cache_expiry:
         return _secret_cache
 
+    import requests  # deferred: only needed when the cached secret has expired
+
     try:
         url = "https://code.thetadev.de/ThetaDev/spotify-secrets/raw/branch/main/secrets/secretDict.json"
         response = requests.get(url, timeout=5)
@@ -58,16 +82,117 @@ def get_latest_totp_secret() -> Tuple[int, bytearray]:
         return _FALLBACK_SECRET
 
 
+def _scan_hashes(js_code: str) -> Dict[str, str]:
+    """Extract operation name -> persisted-query sha256 pairs from a JS pack."""
+    return {m.group(1): m.group(2) for m in _HASH_RE.finditer(js_code)}
+
+
+def _hash_cache_path(client_version: str) -> Path:
+    # Persisted-query hashes only change with the web player build
+    return _CACHE_DIR / f"hashes-{client_version}.json"
+
+
+def _load_hash_cache(client_version: str) -> Dict[str, str] | None:
+    path = _hash_cache_path(client_version)
+    try:
+        cached = json.loads(path.read_text())
+        # Mark the file as in use so _save_hash_cache in other processes keeps it
+        path.touch()
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) and cached else None
+
+
+def _save_hash_cache(client_version: str, hashes: Dict[str, str]) -> None:
+    dest = _hash_cache_path(client_version)
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Other processes may be pinned to other web player builds, so only drop files nobody has used lately
+        cutoff = time.time() - _HASH_CACHE_MAX_AGE
+        for stale in dest.parent.glob("hashes-*.json"):
+            try:
+                if stale != dest and stale.stat().st_mtime < cutoff:
+                    stale.unlink()
+            except FileNotFoundError:
+                pass  # another process got there first
+        dest.write_text(json.dumps(hashes))
+    except OSError as e:
+        Logger.error(f"Failed to cache GraphQL hashes: {e}")
+
+
+class _TokenStore:
+    """
+    Persists access/client tokens on disk so new processes can skip the auth handshake.
+
+    Tokens belong to whoever owns the sp_dc cookie, so the file is keyed on a digest of it.
+    """
+
+    # Refetch slightly before Spotify considers the token expired
+    EXPIRY_MARGIN = 60
+
+    @staticmethod
+    def path(client: TLSClient) -> Path:
+        sp_dc = client.cookies.get("sp_dc") or "anonymous"
+        return _CACHE_DIR / f"tokens-{hashlib.sha256(sp_dc.encode()).hexdigest()[:16]}.json"
+
+    @staticmethod
+    def load(client: TLSClient) -> Dict[str, Any] | None:
+        try:
+            data = json.loads(_TokenStore.path(client).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        # Both tokens are restored together, so the entry is only as good as the sooner expiry
+        expires_at = min(data.get("access_token_expires_at", 0), data.get("client_token_expires_at", 0))
+        if expires_at <= time.time() + _TokenStore.EXPIRY_MARGIN:
+            return None
+
+        return data
+
+    @staticmethod
+    def save(client: TLSClient, data: Dict[str, Any]) -> None:
+        dest = _TokenStore.path(client)
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            # Bearer tokens, so keep them private to the user
+            fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+        except OSError as e:
+            Logger.error(f"Failed to cache auth tokens: {e}")
+
+    @staticmethod
+    def clear(client: TLSClient) -> None:
+        try:
+            _TokenStore.path(client).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 def generate_totp() -> Tuple[str, int]:
+    import pyotp  # deferred: only needed when fetching a fresh access token
+
     version, secret_bytes = get_latest_totp_secret()
-    transformed = [e ^ ((t % 33) + 9) for t, e in enumerate(secret_bytes)]
-    joined = "".join(str(num) for num in transformed)
-    hex_str = joined.encode().hex()
-    secret = base64.b32encode(bytes.fromhex(hex_str)).decode().rstrip("=")
+    transformed = map(operator.xor, secret_bytes, itertools.cycle(_TOTP_MASK))
+    joined = "".join(map(str, transformed)).encode()
+    secret = base64.b32encode(joined).decode().rstrip("=")
     totp = pyotp.TOTP(secret).now()
     return totp, version
 
 
+@functools.lru_cache(maxsize=8)
+def _static_headers(browser_version: str) -> Dict[str, str]:
+    """Browser-identifying headers for a Chrome version. Shared between clients, so never mutate the result."""
+    return {
+        "Content-Type": "application/json;charset=UTF-8",
+        "User-Agent": f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{browser_version}.0.0.0 Safari/537.36",
+        "Sec-Ch-Ua": f'"Chromium";v="{browser_version}", "Not(A:Brand";v="24", "Google Chrome";v="{browser_version}"',
+    }
+
+
 @enforce
 class BaseClient:
     # There are many Javasript packs, but this one contains all the "xpui" packs which contain further packs that contain the hashes we need
@@ -77,65 +202,129 @@ class BaseClient:
     client_token: _UStr = _Undefined
     client_id: _UStr = _Undefined
     device_id: _UStr = _Undefined
-    raw_hashes: _UStr = _Undefined
     language: str = "en"
+    # Unix timestamps; 0 means unknown
+    access_token_expires_at: float = 0
+    client_token_expires_at: float = 0
 
     def __init__(self, client: TLSClient, language: str = "en") -> None:
         self.client = client
         self.language = language
+        self._hash_map: Dict[str, str] = {}
+        # Persisted-query extensions only depend on the operation, so build them once each
+        self._ext_cache: Dict[str, dict] = {}
+        self._ext_json_cache: Dict[str, str] = {}
+        # Merged into every authenticated request; replaced whenever _auth_rule fetches tokens
+        self._auth_headers: Dict[str, str] = {
+            "Authorization": "",
+            "Client-Token": "",
+            "Spotify-App-Version": "",
+            "Accept-Language": language,
+        }
+        # Set once _auth_headers holds usable tokens; lets _auth_rule skip the checks
+        self._auth_ready = False
+        # Serialises session, token and hash fetches and resets between threads sharing this client
+        # (e.g. concurrent pagination or DSL searches), so a cold client loads each only once
+        self._auth_lock = threading.Lock()
         self.client.authenticate = lambda kwargs: self._auth_rule(kwargs)
         self.client.on_auth_failure = self._reset_auth
 
         self.browser_version = self.client.client_identifier.split("_")[1]
-        self.client.headers.update(
-            {
-                "Content-Type": "application/json;charset=UTF-8",
-                "User-Agent": f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{self.browser_version}.0.0.0 Safari/537.36",
-                "Sec-Ch-Ua": f'"Chromium";v="{self.browser_version}", "Not(A:Brand";v="24", "Google Chrome";v="{self.browser_version}"',
-            }
-        )
+        self.client.headers.update(_static_headers(self.browser_version))
+        # TLSClient registers its own atexit close, so nothing is registered per BaseClient
 
-        atexit.register(self.client.close)
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self.client.close()
 
     def _auth_rule(self, kwargs: dict) -> dict:
+        if not self._auth_ready:
+            with self._auth_lock:
+                # Another thread may have fetched tokens while this one waited
+                if not self._auth_ready:
+                    self._refresh_auth_headers()
+
+        kwargs.setdefault("headers", {}).update(self._auth_headers)
+        return kwargs
+
+    def _refresh_auth_headers(self) -> None:
+        if self.client_token is _Undefined and self.access_token is _Undefined:
+            self._load_cached_tokens()
+
+        fetched = self.client_token is _Undefined or self.access_token is _Undefined
+
         if self.client_token is _Undefined:
             self.get_client_token()
 
         if self.access_token is _Undefined:
             self.get_session()
 
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-
-        kwargs["headers"].update(
-            {
-                "Authorization": "Bearer " + str(self.access_token),
-                "Client-Token": self.client_token,
-                "Spotify-App-Version": self.client_version,
-                "Accept-Language": self.language,
-            }.items()
-        )
+        if fetched:
+            self._save_cached_tokens()
 
-        return kwargs
+        # Swapped in whole so threads on the fast path never see a half-updated dict
+        self._auth_headers = {
+            "Authorization": "Bearer " + str(self.access_token),
+            "Client-Token": self.client_token,
+            "Spotify-App-Version": self.client_version,
+            "Accept-Language": self.language,
+        }
+        self._auth_ready = True
 
-    def _reset_auth(self) -> None:
+    def _reset_auth(self, rejected: str | None = None) -> None:
         """Called by TLSClient on 401 — reset tokens so _auth_rule refetches."""
-        self.access_token = _Undefined
-        self.client_token = _Undefined
+        with self._auth_lock:
+            # A 401 for a token another thread already replaced needs no second reset
+            if rejected is not None and rejected != self._auth_headers["Authorization"]:
+                return
+            self._auth_ready = False
+            self.access_token = _Undefined
+            self.client_token = _Undefined
+            _TokenStore.clear(self.client)
+
+    def _load_cached_tokens(self) -> None:
+        cached = _TokenStore.load(self.client)
+        if cached is None:
+            return
+
+        self.access_token = cached["access_token"]
+        self.client_token = cached["client_token"]
+        self.client_version = cached["client_version"]
+        self.client_id = cached["client_id"]
+        self.access_token_expires_at = cached["access_token_expires_at"]
+        self.client_token_expires_at = cached["client_token_expires_at"]
+
+    def _save_cached_tokens(self) -> None:
+        # Without both expiries a later process couldn't tell when the entry goes stale
+        if not (self.access_token_expires_at and self.client_token_expires_at):
+            return
+
+        _TokenStore.save(
+            self.client,
+            {
+                "access_token": self.access_token,
+                "client_token": self.client_token,
+                "client_version": self.client_version,
+                "client_id": self.client_id,
+                "access_token_expires_at": self.access_token_expires_at,
+                "client_token_expires_at": self.client_token_expires_at,
+            },
+        )
 
     def set_language(self, language: str) -> None:
         """Set the language for API requests. Uses ISO 639-1 language codes (e.g., 'ko', 'en', 'ja')."""
         self.language = language
+        self._auth_headers["Accept-Language"] = language
 
     def _get_auth_vars(self) -> None:
         if self.access_token is _Undefined or self.client_id is _Undefined:
+            self._auth_ready = False
             totp, version = generate_totp()
             query = {
                 "reason": "init",
                 "productType": "web-player",
                 "totp": totp,
                 "totpVer": version,
-                "totpVer": version,
                 "totpServer": totp,
             }
             resp = self.client.get("https://open.spotify.com/api/token", params=query)
@@ -145,6 +334,7 @@ class BaseClient:
 
             self.access_token = resp.response["accessToken"]
             self.client_id = resp.response["clientId"]
+            self.access_token_expires_at = resp.response.get("accessTokenExpirationTimestampMs", 0) / 1000
 
     def get_session(self) -> None:
         resp = self.client.get("https://open.spotify.com")
@@ -157,9 +347,11 @@ class BaseClient:
             "",
         )
 
-        self._raw_app_server_config = resp.response.split('<script id="appServerConfig" type="text/plain">')[1].split(
-            "</script>"
-        )[0]
+        match = _APP_CFG_RE.search(resp.response)
+        if match is None:
+            raise BaseClientError("Could not find appServerConfig in session page")
+
+        self._raw_app_server_config = match.group(1)
         self.server_cfg = json.loads(base64.b64decode(self._raw_app_server_config).decode("utf-8"))
 
         _recaptcha_key = self.server_cfg["recaptchaWebPlayerFraudSiteKey"]
@@ -172,6 +364,7 @@ class BaseClient:
         self._get_auth_vars()
 
     def get_client_token(self) -> None:
+        self._auth_ready = False
         if not (self.client_id and self.device_id and self.client_version):
             self.get_session()
 
@@ -207,14 +400,28 @@ class BaseClient:
         if not isinstance(resp.response, Mapping):
             raise BaseClientError("Invalid JSON")
 
-        self.client_token = resp.response["granted_token"]["token"]
+        granted = resp.response["granted_token"]
+        self.client_token = granted["token"]
+        self.client_token_expires_at = time.time() + granted.get("expires_after_seconds", 0)
+
+    def _extensions(self, operation: str) -> dict:
+        ext = self._ext_cache.get(operation)
+        if ext is None:
+            ext = self._ext_cache[operation] = {
+                "persistedQuery": {"version": 1, "sha256Hash": self.part_hash(operation)}
+            }
+        return ext
 
     def graphql_params(self, operation: str, variables: dict) -> dict:
         """Build query params dict for GET-style GraphQL requests."""
+        ext = self._ext_json_cache.get(operation)
+        if ext is None:
+            ext = self._ext_json_cache[operation] = dumps(self._extensions(operation))
+
         return {
             "operationName": operation,
-            "variables": json.dumps(variables),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": self.part_hash(operation)}}),
+            "variables": dumps(variables),
+            "extensions": ext,
         }
 
     def graphql_payload(self, operation: str, variables: dict) -> dict:
@@ -222,20 +429,23 @@ class BaseClient:
         return {
             "variables": variables,
             "operationName": operation,
-            "extensions": {"persistedQuery": {"version": 1, "sha256Hash": self.part_hash(operation)}},
+            "extensions": self._extensions(operation),
         }
 
     def part_hash(self, name: str) -> str:
-        if self.raw_hashes is _Undefined:
-            self.get_sha256_hash()
+        if not self._hash_map:
+            with self._auth_lock:
+                # Another thread may have loaded the hashes while this one waited
+                if not self._hash_map:
+                    self.get_sha256_hash()
 
-        if self.raw_hashes is _Undefined:
+        if not self._hash_map:
             raise ValueError("Could not get playlist hashes")
 
         try:
-            return str(self.raw_hashes).split(f'"{name}","query","')[1].split('"')[0]
-        except IndexError:
-            return str(self.raw_hashes).split(f'"{name}","mutation","')[1].split('"')[0]
+            return self._hash_map[name]
+        except KeyError:
+            raise BaseClientError(f"Could not find hash for operation {name}") from None
 
     def get_sha256_hash(self) -> None:
         if self.js_pack is _Undefined:
@@ -244,24 +454,69 @@ class BaseClient:
         if self.js_pack is _Undefined:
             raise ValueError("Could not get playlist hashes")
 
+        cached = _load_hash_cache(str(self.client_version))
+        if cached:
+            self._hash_map = cached
+            return
+
         resp = self.client.get(str(self.js_pack))
         if resp.fail:
             raise BaseClientError("Could not get general hashes", error=resp.error.string)
 
-        self.raw_hashes = resp.response
-
-        str_mapping, hash_mapping = extract_mappings(str(self.raw_hashes))
-        urls = map(
-            lambda s: f"https://open.spotifycdn.com/cdn/build/web-player/{s}",
-            combine_chunks(hash_mapping, str_mapping),
-        )
-
-        for url in urls:
-            resp = self.client.get(url)
-            if resp.fail:
-                raise BaseClientError("Could not get general hashes", error=resp.error.string)
-
-            self.raw_hashes += resp.response
+        # Scan each pack as it arrives rather than concatenating megabytes of JS
+        hash_map = _scan_hashes(str(resp.response))
+
+        str_mapping, hash_mapping = extract_mappings(str(resp.response))
+        urls = [
+            f"https://open.spotifycdn.com/cdn/build/web-player/{s}" for s in combine_chunks(hash_mapping, str_mapping)
+        ]
+
+        hash_map.update(self._fetch_chunk_hashes(urls))
+        self._hash_map = hash_map
+        _save_hash_cache(str(self.client_version), self._hash_map)
+
+    def _fetch_chunk_hashes(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Download the JS sub-chunks in parallel and scan each for hashes.
+
+        They are public CDN assets, so every worker thread gets its own anonymous session
+        instead of sharing ``self.client``, whose headers, cookies and auth hooks are not thread-safe.
+        """
+        local = threading.local()
+        sessions: List[Session] = []
+
+        def fetch(url: str) -> Dict[str, str]:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = Session(
+                    client_identifier=self.client.client_identifier, random_tls_extension_order=True
+                )
+                session.proxies = self.client.proxies
+                session.headers.update(_static_headers(self.browser_version))
+                sessions.append(session)
+
+            err = "Unknown"
+            for _ in range(self.client.auto_retries):
+                try:
+                    resp = session.get(url)
+                except TLSClientExeption as e:
+                    err = str(e)
+                    continue
+                if resp.status_code != 200:
+                    raise BaseClientError("Could not get general hashes", error=f"Status Code: {resp.status_code}")
+                return _scan_hashes(resp.text or "")
+
+            raise BaseClientError("Could not get general hashes", error=err)
+
+        hash_map: Dict[str, str] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=_CHUNK_FETCH_WORKERS) as pool:
+                for found in pool.map(fetch, urls):
+                    hash_map.update(found)
+        finally:
+            for session in sessions:
+                session.close()
+        return hash_map
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(...)"
@@ -20,12 +20,11 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Union
 
-from lark.exceptions import UnexpectedInput
-
 from clautify.dsl.executor import DSLError, SpotifyExecutor
 from clautify.dsl.parser import parse
 from clautify.login import Login
 from clautify.types import Config
+from clautify.types.alias import _Undefined
 from clautify.utils.logger import NoopLogger
 
 _VALID_COMMANDS = (
@@ -106,10 +105,10 @@ class SpotifySession:
         or {"status": "error", "authenticated": False, "error": "..."} on failure.
         """
         try:
-            from clautify.client import BaseClient
-
-            bc = BaseClient(self._executor._login.client)
-            bc._get_auth_vars()
+            base = self._executor.base
+            # Force a fresh token fetch; the BaseClient is reused across checks
+            base.access_token = _Undefined
+            base._get_auth_vars()
             return {"status": "ok", "authenticated": True}
         except Exception as e:
             return {"status": "error", "authenticated": False, "error": str(e)}
@@ -122,6 +121,8 @@ class SpotifySession:
 
         Raises DSLError on parse or execution failure.
         """
+        from lark.exceptions import UnexpectedInput
+
         try:
             parsed = parse(command)
         except UnexpectedInput as e:
@@ -1,15 +1,19 @@
 """Spotify DSL executor — dispatches parsed command dicts to SpotAPI classes."""
 
-import re
-from typing import Any, Dict, Optional
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from clautify.album import PublicAlbum
 from clautify.artist import Artist
+from clautify.client import BaseClient
 from clautify.exceptions import WebSocketError
 from clautify.login import Login
 from clautify.player import Player
-from clautify.playlist import PrivatePlaylist
+from clautify.playlist import PrivatePlaylist, PublicPlaylist
 from clautify.song import Song
+from clautify.utils.cache import TTLCache
 from clautify.utils.strings import extract_spotify_id as _extract_id
 
 
@@ -21,23 +25,41 @@ class DSLError(Exception):
         super().__init__(message)
 
 
-def _deep_get(data: Any, *keys: str, default: Any = None) -> Any:
-    """Safely traverse nested dicts by key path, returning default on any miss."""
-    for key in keys:
-        if isinstance(data, dict):
-            data = data.get(key)
-        else:
-            return default
-        if data is None:
+def _make_getter(*keys: str) -> Callable[..., Any]:
+    """Build a getter for a fixed key path: ``getter(data, default=None)``.
+
+    Returns default on any miss (missing key, non-dict step, or None value).
+    """
+
+    def getter(data: Any, default: Any = None) -> Any:
+        try:
+            for key in keys:
+                data = data[key]
+        except (KeyError, TypeError, IndexError):
             return default
-    return data
+        return default if data is None else data
 
+    return getter
 
-_BARE_ID_RE = re.compile(r"^[a-zA-Z0-9]{22}$")
+
+_URI_GET = _make_getter("data", "uri")
+_TRACK_URI_GET = _make_getter("item", "data", "uri")
+_PROFILE_NAME_GET = _make_getter("data", "profile", "name")
+_ARTIST_ITEMS_GET = _make_getter("data", "searchV2", "artists", "items")
 
 
 def _is_bare_id(target: str) -> bool:
-    return bool(_BARE_ID_RE.match(target))
+    # Same as /^[a-zA-Z0-9]{22}$/ without the regex; isascii() keeps out non-ASCII digits/letters
+    return len(target) == 22 and target.isascii() and target.isalnum()
+
+
+def _wrap_error(e: Exception, cmd: Dict[str, Any]) -> DSLError:
+    """Convert an API/client exception into a DSLError, keeping any ``error`` detail."""
+    msg = f"{type(e).__name__}: {e}"
+    detail = getattr(e, "error", None)
+    if detail:
+        msg = f"{msg} ({detail})"
+    return DSLError(msg, command=cmd)
 
 
 # --- search section paths (Spotify API response structure) ---
@@ -47,6 +69,16 @@ _SEARCH_SECTION_PATH = {
     "album": ("data", "searchV2", "albumsV2", "items"),
     "playlist": ("data", "searchV2", "playlists", "items"),
 }
+_SEARCH_SECTION_GETTERS = {kind: _make_getter(*path) for kind, path in _SEARCH_SECTION_PATH.items()}
+
+# Seconds a name → URI search resolution is reused
+_RESOLVE_TTL = 60
+# Max concurrent searches when a command names several targets or search terms
+_SEARCH_WORKERS = 8
+
+# Command keys handled by _apply_state_modifiers
+_STATE_MODIFIER_KEYS = ("volume", "volume_rel", "mode", "device")
+_STATE_MODIFIER_KEY_SET = frozenset(_STATE_MODIFIER_KEYS)
 
 # --- library filter strings for Spotify API ---
 
@@ -62,14 +94,20 @@ class SpotifyExecutor:
     """Dispatches parsed DSL command dicts to SpotAPI class methods.
 
     Lazily initializes heavy resources (Player requires WebSocket + threads).
-    No name cache — quoted strings auto-resolve via search, bare IDs used directly.
+    Quoted strings auto-resolve via search (results cached for a minute), bare IDs used directly.
     """
 
+    # Filled in below the class: action/query name -> handler method name
+    _ACTION_TABLE: Dict[str, str]
+    _QUERY_TABLE: Dict[str, str]
+
     def __init__(self, login: Login, eager: bool = True, max_volume: float = 1.0):
         self._login = login
         self._player: Optional[Player] = None
-        self._song: Optional[Song] = None
-        self._artist: Optional[Artist] = None
+        # lowercased device name -> device ID, rebuilt from player.device_ids on a miss
+        self._device_index: Optional[Dict[str, str]] = None
+        # (kind, lowercased name) -> resolved URI
+        self._resolve_cache = TTLCache(maxsize=256, ttl=_RESOLVE_TTL)
         self._max_volume = max(0.0, min(1.0, max_volume))
         if eager:
             _ = self.player
@@ -90,27 +128,37 @@ class SpotifyExecutor:
             except Exception:
                 pass
             self._player = None
+            self._device_index = None
 
-    @property
+    # Never rebuilt once created, so the value is stored in the instance dict and later
+    # reads skip the descriptor; player stays a property because _reset_player replaces it
+
+    @functools.cached_property
     def song(self) -> Song:
-        if self._song is None:
-            sentinel = PrivatePlaylist(self._login, "__sentinel__")
-            self._song = Song(playlist=sentinel)
-        return self._song
+        sentinel = PrivatePlaylist(self._login, "__sentinel__")
+        return Song(playlist=sentinel)
 
-    @property
+    @functools.cached_property
     def artist(self) -> Artist:
-        if self._artist is None:
-            self._artist = Artist(login=self._login)
-        return self._artist
+        return Artist(login=self._login)
+
+    @functools.cached_property
+    def base(self) -> BaseClient:
+        return BaseClient(self._login.client)
 
     def close(self) -> None:
-        """Clean up resources (WebSocket, threads) if Player was created."""
+        """Clean up resources (WebSocket, threads, HTTP client) that were created."""
         if self._player is not None:
             try:
                 self._player.ws.close()
             except Exception:
                 pass
+        base = self.__dict__.pop("base", None)
+        if base is not None:
+            try:
+                base.close()
+            except Exception:
+                pass
 
     # --- target resolution ---
 
@@ -122,25 +170,44 @@ class SpotifyExecutor:
         """
         if _is_bare_id(target):
             return f"spotify:{kind}:{target}"
-        return self._search_and_resolve(kind, target, cmd)
+        return self._resolve_cache.get_or_set(
+            (kind, target.lower()), lambda: self._search_and_resolve(kind, target, cmd)
+        )
+
+    def _resolve_targets(self, kind: str, targets: List[str], cmd: Dict[str, Any]) -> List[str]:
+        """Resolve several targets to URIs, running the name searches concurrently.
+
+        Order matches ``targets``; any failed search raises before a caller mutates anything.
+        """
+        if sum(not _is_bare_id(t) for t in targets) < 2:
+            return [self._resolve_target(kind, t, cmd) for t in targets]
+
+        # Create the lazy search client up front so worker threads don't race to build it
+        _ = self.artist if kind == "artist" else self.song
+        with ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(targets))) as pool:
+            return list(pool.map(lambda t: self._resolve_target(kind, t, cmd), targets))
+
+    def clear_resolve_cache(self) -> None:
+        """Forget all name → URI resolutions."""
+        self._resolve_cache.clear()
 
     def _search_and_resolve(self, kind: str, name: str, cmd: Dict[str, Any]) -> str:
         """Search Spotify for name, return top result URI."""
         if kind == "artist":
             raw = self.artist.query_artists(name, limit=1)
-            items = _deep_get(raw, "data", "searchV2", "artists", "items", default=[])
+            items = _ARTIST_ITEMS_GET(raw, [])
             if not items:
                 raise DSLError(f'No results for "{name}"', command=cmd)
-            uri = _deep_get(items[0], "data", "uri")
+            uri = _URI_GET(items[0])
         else:
             raw = self.song.query_songs(name, limit=1)
             section = self._extract_search_section(raw, kind)
             if not isinstance(section, list) or not section:
                 raise DSLError(f'No results for "{name}"', command=cmd)
             if kind == "track":
-                uri = _deep_get(section[0], "item", "data", "uri")
+                uri = _TRACK_URI_GET(section[0])
             else:
-                uri = _deep_get(section[0], "data", "uri")
+                uri = _URI_GET(section[0])
 
         if not uri:
             raise DSLError(f'No results for "{name}"', command=cmd)
@@ -148,24 +215,25 @@ class SpotifyExecutor:
 
     def _extract_search_section(self, raw: Dict[str, Any], kind: str) -> Any:
         """Extract a specific section from searchDesktop results."""
-        path = _SEARCH_SECTION_PATH.get(kind)
-        if not path:
+        getter = _SEARCH_SECTION_GETTERS.get(kind)
+        if getter is None:
             return raw
-        result = raw
-        for key in path:
-            if isinstance(result, dict):
-                result = result.get(key, {})
-            else:
-                return raw
-        return result
+        return getter(raw, {})
 
     def _resolve_device_id(self, name: str) -> str:
-        """Resolve a friendly device name to a device ID (case-insensitive)."""
-        devices = self.player.device_ids
+        """Resolve a friendly device name to a device ID (case-insensitive).
+
+        Uses the name index from the last device fetch; an unknown name
+        re-fetches once in case the device has just appeared.
+        """
         name_lower = name.lower()
-        for device in devices.devices.values():
-            if device.name.lower() == name_lower:
-                return device.device_id
+        if self._device_index is not None and name_lower in self._device_index:
+            return self._device_index[name_lower]
+
+        devices = self.player.device_ids
+        self._device_index = {d.name.lower(): d.device_id for d in devices.devices.values()}
+        if name_lower in self._device_index:
+            return self._device_index[name_lower]
         available = [d.name for d in devices.devices.values()]
         raise DSLError(f"Device '{name}' not found. Available: {available}")
 
@@ -175,58 +243,55 @@ class SpotifyExecutor:
         """Execute a parsed command dict and return the result."""
         try:
             return self._execute_once(cmd)
-        except (WebSocketError, DSLError) as first:
-            inner = first.__cause__ if isinstance(first, DSLError) else first
-            if not isinstance(inner, WebSocketError) and not isinstance(first, WebSocketError):
-                raise
+        except WebSocketError:
+            # Stale WebSocket: rebuild the Player and retry once
             self._reset_player()
-            try:
-                return self._execute_once(cmd)
-            except DSLError:
-                raise
-            except Exception as e:
-                raise DSLError(f"{type(e).__name__}: {e}", command=cmd) from e
+
+        try:
+            return self._execute_once(cmd)
+        except WebSocketError as e:
+            raise _wrap_error(e, cmd) from e
 
     def _execute_once(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a command once. WebSocketError propagates as-is so execute() can retry it."""
         try:
             if "action" in cmd:
-                result = self._dispatch_action(cmd)
-            elif "query" in cmd:
-                result = self._dispatch_query(cmd)
-            else:
-                raise DSLError("Invalid command: no action or query key", command=cmd)
-            return result
-        except DSLError:
+                return self._dispatch_action(cmd)
+            if "query" in cmd:
+                return self._dispatch_query(cmd)
+            raise DSLError("Invalid command: no action or query key", command=cmd)
+        except (DSLError, WebSocketError):
             raise
         except Exception as e:
-            detail = getattr(e, "error", None)
-            msg = f"{type(e).__name__}: {e}"
-            if detail:
-                msg = f"{msg} ({detail})"
-            raise DSLError(msg, command=cmd) from e
+            raise _wrap_error(e, cmd) from e
 
     # --- action dispatch ---
 
     def _dispatch_action(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
         action = cmd["action"]
 
-        if action in ("pause", "resume"):
-            getattr(self.player, action)()
+        if action == "pause":
+            self.player.pause()
+            result = {"status": "ok", "action": action}
+
+        elif action == "resume":
+            self.player.resume()
             result = {"status": "ok", "action": action}
 
         elif action == "set":
             result = {"status": "ok", "action": "set"}
-            for k in ("volume", "volume_rel", "mode", "device"):
+            for k in _STATE_MODIFIER_KEYS:
                 if k in cmd:
                     result[k] = cmd[k]
 
         else:
-            handler = getattr(self, f"_action_{action}", None)
-            if handler is None:
+            name = self._ACTION_TABLE.get(action)
+            if name is None:
                 raise DSLError(f"Unknown action: {action}", command=cmd)
-            result = handler(cmd)
+            result = getattr(self, name)(cmd)
 
-        self._apply_state_modifiers(cmd)
+        if not _STATE_MODIFIER_KEY_SET.isdisjoint(cmd):
+            self._apply_state_modifiers(cmd)
 
         if "volume" in cmd and "volume" in result:
             result["volume"] = min(cmd["volume"], self._max_volume * 100)
@@ -304,9 +369,9 @@ class SpotifyExecutor:
             raise DSLError(f"Queue only supports tracks — use play for {kind}s", command=cmd)
         targets = cmd["targets"]
         queued = []
-        for target in targets:
-            uri = self._resolve_target(kind, target, cmd)
-            self.player.add_to_queue(uri)
+        add_to_queue = self.player.add_to_queue
+        for target, uri in zip(targets, self._resolve_targets(kind, targets, cmd)):
+            add_to_queue(uri)
             queued.append(target)
         return {"status": "ok", "action": "queue", "kind": kind, "targets": queued}
 
@@ -316,23 +381,10 @@ class SpotifyExecutor:
         context = cmd.get("context")
         context_kind = cmd.get("context_kind")
 
-        for target in targets:
-            uri = self._resolve_target(kind, target, cmd)
-            bare_id = _extract_id(uri, kind)
-
-            if context:
-                playlist_uri = self._resolve_target(context_kind, context, cmd)
-                pl = PrivatePlaylist(self._login, _extract_id(playlist_uri, "playlist"))
-                Song(playlist=pl).add_song_to_playlist(bare_id)
-            elif kind == "track":
-                self.song.like_song(bare_id)
-            elif kind == "artist":
-                self.artist.follow(bare_id)
-            elif kind == "playlist":
-                PrivatePlaylist(self._login, bare_id).add_to_library()
-            elif kind == "album":
-                raise DSLError("Album library management not yet supported", command=cmd)
+        uris = self._resolve_targets(kind, targets, cmd)
+        playlist_uri = self._resolve_target(context_kind, context, cmd) if context else None
 
+        self._mutate_library(kind, uris, playlist_uri, add=True, cmd=cmd)
         return {"status": "ok", "action": "library_add", "kind": kind, "targets": targets}
 
     def _action_library_remove(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
@@ -341,25 +393,56 @@ class SpotifyExecutor:
         context = cmd.get("context")
         context_kind = cmd.get("context_kind")
 
-        for target in targets:
-            uri = self._resolve_target(kind, target, cmd)
-            bare_id = _extract_id(uri, kind)
-
-            if context:
-                playlist_uri = self._resolve_target(context_kind, context, cmd)
-                pl = PrivatePlaylist(self._login, _extract_id(playlist_uri, "playlist"))
-                Song(playlist=pl).remove_song_from_playlist(song_id=bare_id)
-            elif kind == "track":
-                self.song.unlike_song(bare_id)
-            elif kind == "artist":
-                self.artist.unfollow(bare_id)
-            elif kind == "playlist":
-                PrivatePlaylist(self._login, bare_id).remove_from_library()
-            elif kind == "album":
-                raise DSLError("Album library management not yet supported", command=cmd)
+        uris = self._resolve_targets(kind, targets, cmd)
+        playlist_uri = self._resolve_target(context_kind, context, cmd) if context else None
 
+        self._mutate_library(kind, uris, playlist_uri, add=False, cmd=cmd)
         return {"status": "ok", "action": "library_remove", "kind": kind, "targets": targets}
 
+    @contextlib.contextmanager
+    def _playlist_song(self, playlist_uri: Optional[str]) -> Iterator[Optional[Song]]:
+        """Point the shared Song at a playlist for one command, so its authenticated client is reused."""
+        if playlist_uri is None:
+            yield None
+            return
+        song = self.song
+        previous = song.playlist
+        song.playlist = PrivatePlaylist(self._login, _extract_id(playlist_uri, "playlist"))
+        try:
+            yield song
+        finally:
+            song.playlist = previous
+
+    def _mutate_library(
+        self, kind: str, uris: List[str], playlist_uri: Optional[str], *, add: bool, cmd: Dict[str, Any]
+    ) -> None:
+        """Add or remove every resolved URI, in the library or in the context playlist."""
+        bare_ids = [_extract_id(uri, kind) for uri in uris]
+        with self._playlist_song(playlist_uri) as playlist_song:
+            if kind == "artist" and playlist_song is None:
+                # The artist library mutation takes a list of URIs, so all targets share one request
+                (self.artist.follow_many if add else self.artist.unfollow_many)(bare_ids)
+                return
+            mutate = self._library_mutator(kind, playlist_song, add=add, cmd=cmd)
+            for bare_id in bare_ids:
+                mutate(bare_id)
+
+    def _library_mutator(
+        self, kind: str, playlist_song: Optional[Song], *, add: bool, cmd: Dict[str, Any]
+    ) -> Callable[[str], Any]:
+        """Pick the per-item library call for a kind once, before looping over targets."""
+        if playlist_song is not None:
+            if add:
+                return playlist_song.add_song_to_playlist
+            return lambda bare_id: playlist_song.remove_song_from_playlist(song_id=bare_id)
+        if kind == "track":
+            return self.song.like_song if add else self.song.unlike_song
+        if kind == "playlist":
+            if add:
+                return lambda bare_id: PrivatePlaylist(self._login, bare_id).add_to_library()
+            return lambda bare_id: PrivatePlaylist(self._login, bare_id).remove_from_library()
+        raise DSLError("Album library management not yet supported", command=cmd)
+
     def _action_library_create(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
         name = cmd["target"]
         playlist_id = PrivatePlaylist(self._login).create_playlist(name)
@@ -381,10 +464,10 @@ class SpotifyExecutor:
 
     def _dispatch_query(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
         query = cmd["query"]
-        handler = getattr(self, f"_query_{query}", None)
-        if handler is None:
+        name = self._QUERY_TABLE.get(query)
+        if name is None:
             raise DSLError(f"Unknown query: {query}", command=cmd)
-        return handler(cmd)
+        return getattr(self, name)(cmd)
 
     def _query_search(self, cmd: Dict[str, Any]) -> Dict[str, Any]:
         terms = cmd["terms"]
@@ -392,26 +475,27 @@ class SpotifyExecutor:
         limit = cmd.get("limit", 10)
         offset = cmd.get("offset", 0)
 
+        search = self.artist.query_artists if kind == "artist" else self.song.query_songs
+        if len(terms) == 1:
+            raws = [search(terms[0], limit=limit, offset=offset)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(terms))) as pool:
+                raws = list(pool.map(lambda term: search(term, limit=limit, offset=offset), terms))
+
         all_results = []
-        for term in terms:
+        for raw in raws:
             if kind == "artist":
-                raw = self.artist.query_artists(term, limit=limit, offset=offset)
-                try:
-                    items = raw["data"]["searchV2"]["artists"]["items"]
-                    all_results.extend(items)
-                except (KeyError, TypeError):
-                    pass
+                all_results.extend(_ARTIST_ITEMS_GET(raw, []))
             else:
-                raw = self.song.query_songs(term, limit=limit, offset=offset)
                 results = self._extract_search_section(raw, kind)
                 if isinstance(results, list):
                     all_results.extend(results)
 
         # Auto-promote: exact artist match → return info instead of ID list
         if kind == "artist" and len(terms) == 1 and all_results:
-            first_name = _deep_get(all_results[0], "data", "profile", "name", default="")
+            first_name = _PROFILE_NAME_GET(all_results[0], "")
             if first_name.lower() == terms[0].lower():
-                uri = _deep_get(all_results[0], "data", "uri", default="")
+                uri = _URI_GET(all_results[0], "")
                 if uri:
                     bare_id = _extract_id(uri, "artist")
                     data = self.artist.get_artist(bare_id)
@@ -446,8 +530,6 @@ class SpotifyExecutor:
         elif kind == "album":
             data = PublicAlbum(bare_id).get_album_info(limit=limit, offset=offset)
         elif kind == "playlist":
-            from clautify.playlist import PublicPlaylist
-
             data = PublicPlaylist(bare_id).get_playlist_info(limit=limit, offset=offset)
         else:
             raise DSLError(f"Cannot get info for kind: {kind}", command=cmd)
@@ -470,3 +552,13 @@ class SpotifyExecutor:
         uri = self._resolve_target(context_kind, context, cmd)
         data = PrivatePlaylist(self._login, _extract_id(uri, "playlist")).recommended_songs(num_songs=n)
         return {"status": "ok", "query": "recommend", "kind": kind, "context": context, "n": n, "data": data}
+
+
+# Dispatch tables: action/query name -> method name. Handlers are looked up on the
+# instance, so subclass overrides and patched methods are honoured.
+SpotifyExecutor._ACTION_TABLE = {
+    name[len("_action_") :]: name for name in dir(SpotifyExecutor) if name.startswith("_action_")
+}
+SpotifyExecutor._QUERY_TABLE = {
+    name[len("_query_") :]: name for name in dir(SpotifyExecutor) if name.startswith("_query_")
+}
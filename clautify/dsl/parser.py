@@ -1,13 +1,11 @@
 """Spotify DSL parser — Lark grammar + transformer → command dict."""
 
-from pathlib import Path
+from importlib.resources import files
 from typing import Any, Dict
 
 from lark import Lark, Token, Transformer
 
-_GRAMMAR = (Path(__file__).parent / "grammar.lark").read_text()
-
-_parser = Lark(_GRAMMAR, parser="earley", ambiguity="resolve")
+_GRAMMAR = files("clautify.dsl").joinpath("grammar.lark").read_text(encoding="utf-8")
 
 
 class SpotifyTransformer(Transformer):
@@ -20,31 +18,19 @@ class SpotifyTransformer(Transformer):
         return {"query": query, **{k: v for k, v in kwargs.items() if v is not None}}
 
     # --- terminals ---
+    # Plain builtins are called directly on the token (a str subclass), with no wrapper frame
 
-    def BARE_ID(self, t: Token) -> str:
-        return str(t)
+    BARE_ID = staticmethod(str)
+    NUMBER = staticmethod(float)
+    SIGNED_NUMBER = staticmethod(int)
+    VOL_DELTA = staticmethod(int)
+    MODE = staticmethod(str.lower)
+    KIND_KW = staticmethod(str.lower)
+    LIB_MUT = staticmethod(str.lower)
 
     def ESCAPED_STRING(self, t: Token) -> str:
         return str(t)[1:-1]
 
-    def NUMBER(self, t: Token) -> float:
-        return float(t)
-
-    def SIGNED_NUMBER(self, t: Token) -> int:
-        return int(t)
-
-    def VOL_DELTA(self, t: Token) -> int:
-        return int(t)
-
-    def MODE(self, t: Token) -> str:
-        return str(t).lower()
-
-    def KIND_KW(self, t: Token) -> str:
-        return str(t).lower()
-
-    def LIB_MUT(self, t: Token) -> str:
-        return str(t).lower()
-
     def kind(self, items: list) -> str:
         return items[0]
 
@@ -152,7 +138,11 @@ class SpotifyTransformer(Transformer):
         return result
 
 
+# LALR with the transformer inlined: parse and transform happen in one pass; cache=True
+# pickles the grammar analysis to the temp dir so later processes skip it
+_parser = Lark(_GRAMMAR, parser="lalr", cache=True, transformer=SpotifyTransformer())
+
+
 def parse(command: str) -> Dict[str, Any]:
     """Parse a DSL command string into a command dict."""
-    tree = _parser.parse(command)
-    return SpotifyTransformer().transform(tree)
+    return _parser.parse(command)
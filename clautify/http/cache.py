@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import copy
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Tuple
+
+from clautify.http.data import Response
+
+__all__ = ["ResponseCache", "READ_ONLY_OPERATIONS"]
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Pathfinder operations that only read; everything else sent by POST may mutate and is never cached
+READ_ONLY_OPERATIONS = frozenset(
+    {
+        "fetchPlaylist",
+        "getAlbum",
+        "getTrack",
+        "queryArtistOverview",
+        "searchArtists",
+        "searchDesktop",
+    }
+)
+
+# Request headers that never change the response body, so they stay out of the key
+_UNKEYED_HEADERS = frozenset({"if-none-match"})
+
+
+def _copy(response: Response) -> Response:
+    """Fresh Response around a deep copy of the body, so callers can't mutate a cached entry."""
+    return Response(raw=response.raw, status_code=response.status_code, response=copy.deepcopy(response.response))
+
+
+def _max_age(cache_control: str) -> int:
+    """Seconds a response may be reused for, 0 if it must not be stored."""
+    directives = cache_control.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    match = _MAX_AGE_RE.search(directives)
+    return int(match.group(1)) if match else 0
+
+
+class ResponseCache:
+    """
+    In-memory HTTP response cache honouring ``Cache-Control: max-age`` and ``ETag``.
+
+    Fresh entries are served without a request. Stale entries that carried an
+    ETag are revalidated with ``If-None-Match``, and a 304 reuses the stored body.
+    Only requests passing :meth:`cacheable` should be looked up or stored, and
+    every response handed out is a copy.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        # key -> (expires_at, etag, response)
+        self._entries: OrderedDict[Hashable, Tuple[float, str | None, Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cacheable(method: str, kwargs: Mapping[str, Any]) -> bool:
+        """GETs, and POSTs of a read-only pathfinder operation; anything that may mutate goes to the server."""
+        if method == "GET":
+            return True
+        if method != "POST" or kwargs.get("data") is not None:
+            return False
+        body = kwargs.get("json")
+        params = kwargs.get("params")
+        if body is not None:
+            operation = body.get("operationName") if isinstance(body, dict) else None
+        else:
+            operation = params.get("operationName") if isinstance(params, dict) else None
+        return operation in READ_ONLY_OPERATIONS
+
+    @staticmethod
+    def key(method: str, url: str, kwargs: Dict[str, Any], headers: Mapping[str, str] | None = None) -> Hashable:
+        """``headers`` are the ones actually sent (auth and Accept-Language included), so identities never mix."""
+        keyed = {k.lower(): v for k, v in (headers or {}).items() if k.lower() not in _UNKEYED_HEADERS}
+        body = json.dumps(
+            [kwargs.get("params"), kwargs.get("json"), kwargs.get("data"), keyed],
+            sort_keys=True,
+            default=str,
+        )
+        return method, url, body
+
+    def lookup(self, key: Hashable) -> Tuple[Response | None, str | None]:
+        """Return ``(fresh_response, None)`` on a hit, else ``(None, etag_to_revalidate)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(key)
+            expires_at, etag, response = entry
+            if expires_at > time.monotonic():
+                return _copy(response), None
+            return None, etag
+
+    def store(self, key: Hashable, response: Response) -> Response:
+        """Record ``response`` and return what the caller should use (the cached body on a 304)."""
+        headers = {k.lower(): v for k, v in response.raw.headers.items()}
+        ttl = _max_age(headers.get("cache-control", ""))
+        etag = headers.get("etag")
+
+        with self._lock:
+            if response.status_code == 304:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return response
+                stored = entry[2]
+                etag = etag or entry[1]
+            elif response.status_code != 200 or not (ttl or etag):
+                self._entries.pop(key, None)
+                return response
+            else:
+                stored = _copy(response)
+
+            self._entries[key] = (time.monotonic() + ttl, etag, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return _copy(stored) if response.status_code == 304 else response
+
+    def invalidate(self, fragment: str) -> None:
+        """Drop every entry whose request URL or body contains ``fragment`` (e.g. a playlist URI)."""
+        with self._lock:
+            stale = [key for key in self._entries if any(fragment in part for part in key[1:])]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+__all__ = ["TokenBucket", "HostRateLimiter", "parse_retry_after"]
+
+# Never sleep longer than this on a single Retry-After, whatever the server asks for
+MAX_RETRY_AFTER = 30.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` tokens per second, holding at most ``burst``.
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so no token is handed out for ``seconds``."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+            self._updated = now
+
+
+class HostRateLimiter:
+    """One :class:`TokenBucket` per host."""
+
+    __slots__ = ("rate", "burst", "_buckets", "_lock")
+
+    def __init__(self, rate: float = 10.0, burst: int = 20) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds form), capped at MAX_RETRY_AFTER."""
+    try:
+        seconds = float(value) if value else default
+    except ValueError:
+        # HTTP-date form is not used by Spotify; fall back to the default
+        seconds = default
+    return max(0.0, min(seconds, MAX_RETRY_AFTER))
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import atexit
 import json
+import threading
+import time
 from typing import Any, Callable, Dict, Type
 
 import requests
@@ -10,19 +12,27 @@ from tls_client.exceptions import TLSClientExeption
 from tls_client.response import Response as TLSResponse
 from tls_client.settings import ClientIdentifiers
 
+from clautify._json import dumps
 from clautify.exceptions import ParentException, RequestError
+from clautify.http.cache import ResponseCache
 from clautify.http.data import Response
+from clautify.http.ratelimit import HostRateLimiter, TokenBucket, parse_retry_after
 
 __all__ = [
     "StdClient",
     "ClientIdentifiers",
     "TLSClient",
+    "new_default_client",
     "ParentException",
     "RequestError",
     "Response",
 ]
 
 
+# Entries are keyed on the headers actually sent (tokens included), so clients never see each other's responses
+_shared_response_cache = ResponseCache(maxsize=512)
+
+
 class StdClient:
     """
     Standard HTTP Client implementation wrapped around the requests library.
@@ -44,6 +54,11 @@ class StdClient:
         self.authenticate = auth_rule
         atexit.register(self._client.close)
 
+    def close(self) -> None:
+        """Close the session and drop its exit hook, so a closed client isn't kept alive until exit."""
+        atexit.unregister(self._client.close)
+        self._client.close()
+
     def __call__(self, method: str, url: str, **kwargs) -> requests.Response | None:
         return self.build_request(method, url, **kwargs)
 
@@ -110,17 +125,39 @@ class TLSClient(Session):
         *,
         auto_retries: int = 0,
         auth_rule: Callable[[Dict[Any, Any]], Dict[Any, Any]] | None = None,
+        transport: TLSClient | None = None,
     ) -> None:
         super().__init__(client_identifier=profile, random_tls_extension_order=True)
+        # With a transport, requests ride its native session (pooled connections, no new TLS handshake)
+        # and its rate limiter, while headers, cookies and auth hooks stay on this client.
+        # Only the session's owner closes it.
+        self._owns_session = transport is None
+        if transport is not None:
+            self._session_id = transport._session_id
 
         if proxy:
             self.proxies = {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
         self.auto_retries = auto_retries + 1
         self.authenticate = auth_rule
-        self.on_auth_failure: Callable[[], None] | None = None
+        # Called with the rejected Authorization header when an authenticated request gets a 401
+        self.on_auth_failure: Callable[[str | None], None] | None = None
         self.fail_exception: Type[ParentException] | None = None
-        atexit.register(self.close)
+        # Authenticated read-only API responses are reused as long as their Cache-Control allows; None disables.
+        # One process-wide cache by default, so invalidating after a write reaches every reader.
+        self.response_cache: ResponseCache | None = _shared_response_cache
+        # Per-host token buckets for authenticated API requests; None disables
+        self.rate_limiter: HostRateLimiter | None = transport.rate_limiter if transport else HostRateLimiter()
+        if self._owns_session:
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Release the native session and drop its exit hook, so a closed client isn't kept alive until exit."""
+        if not self._owns_session:
+            return
+        self._owns_session = False
+        atexit.unregister(self.close)
+        super().close()
 
     def __call__(self, method: str, url: str, **kwargs) -> TLSResponse | None:
         return self.build_request(method, url, **kwargs)
@@ -129,6 +166,10 @@ class TLSClient(Session):
         if isinstance(url, (bytes, memoryview)):
             url = url.tobytes().decode("utf-8") if isinstance(url, memoryview) else url.decode("utf-8")
 
+        # tls_client would encode dict bodies with stdlib json; hand it a ready string instead
+        if isinstance(kwargs.get("json"), (dict, list)):
+            kwargs["json"] = dumps(kwargs["json"])
+
         err = "Unknown"
         for _ in range(self.auto_retries):
             try:
@@ -166,33 +207,83 @@ class TLSClient(Session):
 
         resp = Response(status_code=int(response.status_code), response=body, raw=response)
 
-        if danger and self.fail_exception and resp.fail:
+        if danger:
+            self._raise_on_fail(resp, method)
+
+        return resp
+
+    def _raise_on_fail(self, resp: Response, method: str) -> None:
+        if self.fail_exception and resp.fail:
             raise self.fail_exception(
-                f"Could not {method} {str(response.url).split('?')[0]}. Status Code: {resp.status_code}",
+                f"Could not {method} {str(resp.raw.url).split('?')[0]}. Status Code: {resp.status_code}",
                 "Request Failed.",
             )
 
-        return resp
+    def _with_auth(self, kwargs: Dict[str, Any], authenticate: bool) -> Dict[str, Any]:
+        """Copy of ``kwargs`` with the auth headers applied, leaving the caller's headers dict untouched."""
+        if not authenticate or self.authenticate is None:
+            return kwargs
+        return self.authenticate({**kwargs, "headers": dict(kwargs.get("headers") or {})})
 
-    def _do_request(
-        self, method: str, url: str | bytes, *, authenticate: bool, danger: bool = False, **kwargs
-    ) -> Response:
-        if authenticate and self.authenticate is not None:
-            kwargs = self.authenticate(kwargs)
+    def _do_request(self, method: str, url: str | bytes, **kwargs) -> Response:
         response = self.build_request(method, url, allow_redirects=True, **kwargs)
         if response is None:
             raise TLSClientExeption("Request kept failing after retries.")
-        return self.parse_response(response, method, danger)
+        return self.parse_response(response, method, False)
+
+    def _limited_request(self, bucket: TokenBucket | None, method: str, url: str | bytes, **kwargs) -> Response:
+        """Send through the host's token bucket, waiting out 429s per Retry-After."""
+        for attempt in range(self.auto_retries):
+            if bucket is not None:
+                bucket.acquire()
+            parsed = self._do_request(method, url, **kwargs)
+            if parsed.status_code != 429 or attempt == self.auto_retries - 1:
+                return parsed
+
+            delay = parse_retry_after(parsed.raw.headers.get("Retry-After"))
+            if bucket is not None:
+                # Hold back every thread using this host, not just this one
+                bucket.pause(delay)
+            else:
+                time.sleep(delay)
+        return parsed
 
     def _authenticated_request(
         self, method: str, url: str | bytes, *, authenticate: bool, danger: bool = False, **kwargs
     ) -> Response:
-        parsed = self._do_request(method, url, authenticate=authenticate, danger=danger, **kwargs)
+        # Authenticate once up front: the same headers key the cache and go out on every 429 retry
+        sent = self._with_auth(kwargs, authenticate)
+
+        cache = self.response_cache if authenticate else None
+        if cache is not None and not cache.cacheable(method, kwargs):
+            cache = None
+        if cache is not None:
+            key = cache.key(method, str(url), sent, sent.get("headers"))
+            cached, etag = cache.lookup(key)
+            if cached is not None:
+                return cached
+            if etag:
+                sent["headers"] = {**sent.get("headers", {}), "If-None-Match": etag}
+
+        # Failures are only raised once 429/401 retries and 304 revalidation have had their say
+        bucket = self.rate_limiter.bucket(str(url)) if (authenticate and self.rate_limiter is not None) else None
+        parsed = self._limited_request(bucket, method, url, **sent)
 
         # 401 → reset auth → retry once
         if parsed.status_code == 401 and self.on_auth_failure:
-            self.on_auth_failure()
-            parsed = self._do_request(method, url, authenticate=authenticate, danger=danger, **kwargs)
+            # Pass the rejected token so concurrent 401s for it only reset once
+            self.on_auth_failure((sent.get("headers") or {}).get("Authorization"))
+            sent = self._with_auth(kwargs, authenticate)
+            parsed = self._limited_request(bucket, method, url, **sent)
+            if cache is not None:
+                # Fresh tokens mean a different identity in the key
+                key = cache.key(method, str(url), sent, sent.get("headers"))
+
+        if cache is not None:
+            parsed = cache.store(key, parsed)
+
+        if danger:
+            self._raise_on_fail(parsed, method)
 
         return parsed
 
@@ -221,3 +312,21 @@ class TLSClient(Session):
     ) -> Response:
         """Routes a PUT Request"""
         return self._authenticated_request("PUT", url, authenticate=authenticate, danger=danger, **kwargs)
+
+
+_default_transport: TLSClient | None = None
+_default_transport_lock = threading.Lock()
+
+
+def new_default_client() -> TLSClient:
+    """Anonymous TLSClient for an API object built without one.
+
+    Each call returns its own client, since every BaseClient binds its auth hooks and headers onto it,
+    but all of them share one process-wide native session, so none opens a connection of its own or
+    needs closing.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = TLSClient("chrome_120", "", auto_retries=3)
+    return TLSClient("chrome_120", "", auto_retries=3, transport=_default_transport)
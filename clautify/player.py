@@ -72,6 +72,7 @@ class Player(PlayerStatus):
             "command_id": random_hex_string(32),  # This is random for some reason
         }
         resp = self.client.post(url, json=payload, authenticate=True)
+        self.invalidate_state()
 
         if resp.fail:
             raise PlayerError("Could not transfer player", error=resp.error.string)
@@ -81,6 +82,7 @@ class Player(PlayerStatus):
             f"https://gue1-spclient.spotify.com/connect-state/v1/player/command/from/{from_device_id}/to/{to_device_id}"
         )
         resp = self.client.post(url, json=payload, authenticate=True)
+        self.invalidate_state()
 
         if resp.fail:
             raise PlayerError("Could not send command", error=resp.error.string)
@@ -133,6 +135,7 @@ class Player(PlayerStatus):
         )
         payload = {"volume": sixteen_bit_rep}
         resp = self.client.put(url, json=payload, authenticate=True)
+        self.invalidate_state()
 
         if resp.fail:
             raise PlayerError("Could not set volume", error=resp.error.string)
@@ -269,7 +272,6 @@ class Player(PlayerStatus):
             extended_uids, stop = Song.parse_playlist_items(
                 items,
                 song_id=track,
-                all_instances=True,
             )
             uids.extend(extended_uids)
 
@@ -7,15 +7,17 @@ from typing import Any, List, Optional
 
 from clautify.client import BaseClient
 from clautify.exceptions import PlaylistError
-from clautify.http.request import TLSClient
+from clautify.http.request import TLSClient, new_default_client
 from clautify.login import Login
 from clautify.types.annotations import enforce
 from clautify.user import User
-from clautify.utils.pagination import paginate
+from clautify.utils.pagination import paginate_concurrent
 from clautify.utils.strings import extract_spotify_id
 
 __all__ = ["PublicPlaylist", "PrivatePlaylist", "PlaylistError"]
 
+_PLAYLIST_URI_RE = re.compile(r"spotify:playlist:[a-zA-Z0-9]{22}")
+
 
 @enforce
 class PublicPlaylist:
@@ -26,13 +28,14 @@ class PublicPlaylist:
     Parameters
     ----------
     playlist (Optional[str]): The Spotify URI of the playlist.
-    client (TLSClient): An instance of TLSClient to use for requests.
+    client (Optional[TLSClient]): An instance of TLSClient to use for requests. Defaults to an anonymous shared one.
     """
 
     __slots__ = (
         "base",
         "playlist_id",
         "playlist_link",
+        "playlist_uri",
     )
 
     def __init__(
@@ -40,12 +43,13 @@ class PublicPlaylist:
         playlist: str,
         /,
         *,
-        client: TLSClient = TLSClient("chrome_120", "", auto_retries=3),
+        client: TLSClient | None = None,
         language: str = "en",
     ) -> None:
-        self.base = BaseClient(client=client, language=language)
+        self.base = BaseClient(client=client or new_default_client(), language=language)
         self.playlist_id = extract_spotify_id(playlist, "playlist")
         self.playlist_link = f"https://open.spotify.com/playlist/{self.playlist_id}"
+        self.playlist_uri = f"spotify:playlist:{self.playlist_id}"
 
     def get_playlist_info(
         self,
@@ -59,7 +63,7 @@ class PublicPlaylist:
         params = self.base.graphql_params(
             "fetchPlaylist",
             {
-                "uri": f"spotify:playlist:{self.playlist_id}",
+                "uri": self.playlist_uri,
                 "offset": offset,
                 "limit": limit,
                 "enableWatchFeedEntrypoint": enable_watch_feed_entrypoint,
@@ -77,11 +81,12 @@ class PublicPlaylist:
 
     def paginate_playlist(self) -> Generator[Mapping[str, Any], None, None]:
         """Generator that fetches playlist content in chunks."""
-        return paginate(
+        return paginate_concurrent(
             lambda limit, offset: self.get_playlist_info(limit=limit, offset=offset),
             "data.playlistV2.content.totalCount",
             "data.playlistV2.content",
             upper_limit=343,
+            key="fetchPlaylist",
         )
 
 
@@ -101,6 +106,8 @@ class PrivatePlaylist:
         "user",
         "_playlist",
         "playlist_id",
+        "playlist_uri",
+        "_rootlist_url",
     )
 
     def __init__(
@@ -113,14 +120,19 @@ class PrivatePlaylist:
         if not login.logged_in:
             raise ValueError("Must be logged in")
 
+        # None until a playlist is given, so callers can check without hasattr
+        self.playlist_uri: str | None = None
         if playlist:
             self.playlist_id = extract_spotify_id(playlist, "playlist")
+            self.playlist_uri = f"spotify:playlist:{self.playlist_id}"
 
         self.base = BaseClient(login.client, language=language)
         self.login = login
         self.user = User(login)
         # We need to check if a user can use a method
         self._playlist: bool = bool(playlist)
+        # Built on first use: resolving the username costs a request
+        self._rootlist_url: str | None = None
 
     def set_playlist(self, playlist: str) -> None:
         playlist = extract_spotify_id(playlist, "playlist")
@@ -128,14 +140,22 @@ class PrivatePlaylist:
             raise ValueError("Playlist not set")
 
         setattr(self, "playlist_id", playlist)
+        self.playlist_uri = f"spotify:playlist:{playlist}"
         self._playlist = True
 
+    def _rootlist_changes_url(self) -> str:
+        if self._rootlist_url is None:
+            self._rootlist_url = (
+                f"https://spclient.wg.spotify.com/playlist/v2/user/{self.user.username}/rootlist/changes"
+            )
+        return self._rootlist_url
+
     def add_to_library(self) -> None:
         """Adds the playlist to your library"""
         if not self._playlist:
             raise ValueError("Playlist not set")
 
-        url = f"https://spclient.wg.spotify.com/playlist/v2/user/{self.user.username}/rootlist/changes"
+        url = self._rootlist_changes_url()
         payload = {
             "deltas": [
                 {
@@ -145,7 +165,7 @@ class PrivatePlaylist:
                             "add": {
                                 "items": [
                                     {
-                                        "uri": f"spotify:playlist:{self.playlist_id}",
+                                        "uri": self.playlist_uri,
                                         "attributes": {
                                             "timestamp": int(time.time()),
                                             "formatAttributes": [],
@@ -175,7 +195,7 @@ class PrivatePlaylist:
         if not self._playlist:
             raise ValueError("Playlist not set")
 
-        url = f"https://spclient.wg.spotify.com/playlist/v2/user/{self.user.username}/rootlist/changes"
+        url = self._rootlist_changes_url()
         payload = {
             "deltas": [
                 {
@@ -183,7 +203,7 @@ class PrivatePlaylist:
                         {
                             "kind": 3,
                             "rem": {
-                                "items": [{"uri": f"spotify:playlist:{self.playlist_id}"}],
+                                "items": [{"uri": self.playlist_uri}],
                                 "itemsAsKey": True,
                             },
                         }
@@ -268,8 +288,7 @@ class PrivatePlaylist:
         if resp.fail:
             raise PlaylistError("Could not stage create playlist", error=resp.error.string)
 
-        pattern = r"spotify:playlist:[a-zA-Z0-9]+"
-        matched = re.search(pattern, resp.response)
+        matched = _PLAYLIST_URI_RE.search(resp.response)
 
         if not matched:
             raise PlaylistError("Could not find desired playlist ID")
@@ -279,7 +298,7 @@ class PrivatePlaylist:
     def create_playlist(self, name: str) -> str:
         """Creates a new playlist"""
         playlist_id = self._stage_create_playlist(name)
-        url = f"https://spclient.wg.spotify.com/playlist/v2/user/{self.user.username}/rootlist/changes"
+        url = self._rootlist_changes_url()
         payload = {
             "deltas": [
                 {
@@ -320,7 +339,7 @@ class PrivatePlaylist:
         """Gets the recommended songs for the playlist"""
         url = "https://spclient.wg.spotify.com/playlistextender/extendp/"
         payload = {
-            "playlistURI": f"spotify:playlist:{self.playlist_id}",
+            "playlistURI": self.playlist_uri,
             "trackSkipIDs": [],
             "numResults": num_songs,
         }
@@ -3,14 +3,17 @@ from typing import Any, List, Tuple
 
 from clautify.client import BaseClient
 from clautify.exceptions import SongError
-from clautify.http.request import TLSClient
+from clautify.http.request import TLSClient, new_default_client
 from clautify.playlist import PrivatePlaylist, PublicPlaylist
 from clautify.types.annotations import enforce
-from clautify.utils.pagination import paginate
+from clautify.utils.pagination import paginate_concurrent
 from clautify.utils.strings import extract_spotify_id
 
 __all__ = ["Song", "SongError"]
 
+# URIs per addToPlaylist request; larger payloads are slow and risk rejection
+_ADD_BATCH = 100
+
 
 @enforce
 class Song:
@@ -33,11 +36,13 @@ class Song:
         self,
         playlist: PrivatePlaylist | None = None,
         *,
-        client: TLSClient = TLSClient("chrome_120", "", auto_retries=3),
+        client: TLSClient | None = None,
         language: str = "en",
     ) -> None:
         self.playlist = playlist
-        self.base = BaseClient(client=playlist.login.client if playlist else client, language=language)
+        self.base = BaseClient(
+            client=playlist.login.client if playlist else (client or new_default_client()), language=language
+        )
 
     def get_track_info(self, track_id: str) -> Mapping[str, Any]:
         """
@@ -86,36 +91,57 @@ class Song:
 
     def paginate_songs(self, query: str, /) -> Generator[Mapping[str, Any], None, None]:
         """Generator that fetches songs in chunks."""
-        return paginate(
+        return paginate_concurrent(
             lambda limit, offset: self.query_songs(query, limit=limit, offset=offset),
             "data.searchV2.tracksV2.totalCount",
             "data.searchV2.tracksV2.items",
             upper_limit=100,
+            key="searchDesktop",
         )
 
     def add_songs_to_playlist(self, song_ids: List[str], /) -> None:
-        """Adds multiple songs to the playlist"""
-        # This can be a bit slow when adding 500+ songs, maybe we should add a batch processing
-        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+        """Adds multiple songs to the playlist.
+
+        Songs are sent in batches of 100, and the add is not atomic: if a batch fails, the batches
+        before it stay in the playlist.
+        """
+        if self.playlist is None or self.playlist.playlist_uri is None:
             raise ValueError("Playlist not set")
 
         url = "https://api-partner.spotify.com/pathfinder/v1/query"
-        payload = self.base.graphql_payload(
-            "addToPlaylist",
-            {
-                "uris": [f"spotify:track:{song_id}" for song_id in song_ids],
-                "playlistUri": f"spotify:playlist:{self.playlist.playlist_id}",
-                "newPosition": {"moveType": "BOTTOM_OF_PLAYLIST", "fromUid": None},
-            },
-        )
-        resp = self.base.client.post(url, json=payload, authenticate=True)
+        uris = [f"spotify:track:{extract_spotify_id(song_id, 'track')}" for song_id in song_ids]
+        playlist_uri = self.playlist.playlist_uri
+
+        try:
+            # Batches are sent one after another: each is appended to the bottom, so order matters
+            for start in range(0, len(uris), _ADD_BATCH):
+                payload = self.base.graphql_payload(
+                    "addToPlaylist",
+                    {
+                        "uris": uris[start : start + _ADD_BATCH],
+                        "playlistUri": playlist_uri,
+                        "newPosition": {"moveType": "BOTTOM_OF_PLAYLIST", "fromUid": None},
+                    },
+                )
+                resp = self.base.client.post(url, json=payload, authenticate=True)
 
-        if resp.fail:
-            raise SongError("Could not add songs to playlist", error=resp.error.string)
+                if resp.fail:
+                    raise SongError("Could not add songs to playlist", error=resp.error.string)
+        finally:
+            # Earlier batches may have landed even if a later one failed
+            self._invalidate_playlist()
 
     def add_song_to_playlist(self, song_id: str, /) -> None:
         """Adds a song to the playlist"""
-        self.add_songs_to_playlist([extract_spotify_id(song_id, "track")])
+        self.add_songs_to_playlist([song_id])
+
+    def _invalidate_playlist(self) -> None:
+        """Forget cached pages of the playlist after it was modified, for every client reading it."""
+        if self.playlist is None or self.playlist.playlist_uri is None:
+            raise ValueError("Playlist not set")
+        cache = self.base.client.response_cache
+        if cache is not None:
+            cache.invalidate(self.playlist.playlist_uri)
 
     def _stage_remove_song(self, uids: List[str]) -> None:
         # If None, something internal went wrong
@@ -125,7 +151,7 @@ class Song:
         payload = self.base.graphql_payload(
             "removeFromPlaylist",
             {
-                "playlistUri": f"spotify:playlist:{self.playlist.playlist_id}",
+                "playlistUri": self.playlist.playlist_uri,
                 "uids": uids,
             },
         )
@@ -134,6 +160,8 @@ class Song:
         if resp.fail:
             raise SongError("Could not remove song from playlist", error=resp.error.string)
 
+        self._invalidate_playlist()
+
     @staticmethod
     def parse_playlist_items(
         items: Iterable[Mapping[str, Any]],
@@ -142,15 +170,19 @@ class Song:
         song_name: str | None = None,
         all_instances: bool = False,
     ) -> Tuple[List[str], bool]:
+        """Collect uids of matching items; the flag is True once scanning can stop."""
         uids: List[str] = []
+        song_name = song_name and song_name.lower()
         for item in items:
-            is_song_id = song_id and song_id in item["itemV2"]["data"]["uri"]
-            is_song_name = song_name and song_name.lower() in str(item["itemV2"]["data"]["name"]).lower()
+            data = item["itemV2"]["data"]
+            is_song_id = song_id and song_id in data["uri"]
+            is_song_name = song_name and song_name in str(data["name"]).lower()
 
             if is_song_id or is_song_name:
                 uids.append(item["uid"])
 
-                if all_instances:
+                # Only all_instances needs the rest of the playlist
+                if not all_instances:
                     return uids, True
 
         return uids, False
@@ -176,7 +208,7 @@ class Song:
         if all_instances and song_id:
             raise ValueError("Cannot provide both song_id and all_instances")
 
-        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+        if self.playlist is None or self.playlist.playlist_uri is None:
             raise ValueError("Playlist not set")
 
         playlist = PublicPlaylist(self.playlist.playlist_id).paginate_playlist()
@@ -205,7 +237,7 @@ class Song:
         self._stage_remove_song(uids)
 
     def like_song(self, song_id: str, /) -> None:
-        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+        if self.playlist is None or self.playlist.playlist_uri is None:
             raise ValueError("Playlist not set")
 
         song_id = extract_spotify_id(song_id, "track")
@@ -223,7 +255,7 @@ class Song:
             raise SongError("Could not like song", error=resp.error.string)
 
     def unlike_song(self, song_id: str, /) -> None:
-        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+        if self.playlist is None or self.playlist.playlist_uri is None:
             raise ValueError("Playlist not set")
 
         song_id = extract_spotify_id(song_id, "track")
@@ -1,4 +1,4 @@
-import functools
+import time
 from typing import Any, Dict, List
 
 from clautify.login import Login
@@ -25,13 +25,28 @@ class PlayerStatus(WebsocketStreamer):
         The login instance used for authentication.
     s_device_id : Optional[str], optional
         The device ID to use for the player. If None, a new device ID will be generated.
+    state_max_age : float, optional
+        Seconds a fetched state is reused by ``state`` and the device properties. Defaults to 1.0.
     """
 
-    _device_dump: Dict[str, Any] | None = None
-    _state: Dict[str, Any] | None = None
-    _devices: Dict[str, Any] | None = None
-
-    def __init__(self, login: Login, s_device_id: str | None = None) -> None:
+    __slots__ = (
+        "state_max_age",
+        "_device_dump",
+        "_state",
+        "_devices",
+        "_state_fetched_at",
+        "_saved_state",
+        "_saved_device_ids",
+    )
+
+    def __init__(self, login: Login, s_device_id: str | None = None, *, state_max_age: float = 1.0) -> None:
+        self.state_max_age = state_max_age
+        self._device_dump: Dict[str, Any] | None = None
+        self._state: Dict[str, Any] | None = None
+        self._devices: Dict[str, Any] | None = None
+        self._state_fetched_at: float | None = None
+        self._saved_state: PlayerState | None = None
+        self._saved_device_ids: Devices | None = None
         super().__init__(login)
 
         if s_device_id:
@@ -44,31 +59,57 @@ class PlayerStatus(WebsocketStreamer):
         self._device_dump = self.connect_device()
         self._state = self._device_dump["player_state"]
         self._devices = self._device_dump["devices"]
+        self._state_fetched_at = time.monotonic()
+
+    def invalidate_state(self) -> None:
+        """Make the next state read fetch again, e.g. after sending a player command."""
+        self._state_fetched_at = None
+
+    def _ensure_fresh_state(self) -> None:
+        fetched_at = self._state_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at >= self.state_max_age:
+            self.renew_state()
+
+    def refresh_state(self) -> PlayerState:
+        """Fetches and returns the current state of the player, ignoring state_max_age."""
+        self.renew_state()
 
-    @functools.cached_property
+        if self._state is None:
+            raise ValueError("Could not get player state")
+
+        return PlayerState.from_dict(self._state)
+
+    @property
     def saved_state(self) -> PlayerState:
         """Gets the last saved state of the player."""
+        if self._saved_state is not None:
+            return self._saved_state
+
         if self._state is None:
             self.renew_state()
 
         if self._state is None:
             raise ValueError("Could not get player state")
 
-        return PlayerState.from_dict(self._state)
+        self._saved_state = PlayerState.from_dict(self._state)
+        return self._saved_state
 
     @property
     def state(self) -> PlayerState:
-        """Gets the current state of the player."""
-        self.renew_state()
+        """Gets the current state of the player, reusing a fetch younger than state_max_age."""
+        self._ensure_fresh_state()
 
         if self._state is None:
             raise ValueError("Could not get player state")
 
         return PlayerState.from_dict(self._state)
 
-    @functools.cached_property
+    @property
     def saved_device_ids(self) -> Devices:
         """Gets the last saved device IDs of the player."""
+        if self._saved_device_ids is not None:
+            return self._saved_device_ids
+
         if self._devices is None:
             self.renew_state()
 
@@ -78,12 +119,13 @@ class PlayerStatus(WebsocketStreamer):
         if self._device_dump is None or self._device_dump.get("active_device_id") is None:
             raise ValueError("Could not get active device ID")
 
-        return Devices.from_dict(self._devices, self._device_dump["active_device_id"])
+        self._saved_device_ids = Devices.from_dict(self._devices, self._device_dump["active_device_id"])
+        return self._saved_device_ids
 
     @property
     def device_ids(self) -> Devices:
         """Gets the current device IDs of the player."""
-        self.renew_state()
+        self._ensure_fresh_state()
 
         if self._devices is None:
             raise ValueError("Could not get devices")
@@ -98,7 +140,7 @@ class PlayerStatus(WebsocketStreamer):
     @property
     def active_device_id(self) -> str:
         """Gets the active device ID of the player."""
-        self.renew_state()
+        self._ensure_fresh_state()
 
         if self._device_dump is None or self._device_dump.get("active_device_id") is None:
             raise ValueError("Could not get active device ID")
@@ -0,0 +1,48 @@
+"""Small thread-safe TTL + LRU cache for values computed in-process (e.g. name lookups)."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, Tuple
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after insertion.
+
+    The least recently used entry is evicted once ``maxsize`` is exceeded.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int = 512, ttl: float = 600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``factory`` on a miss or expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(key)
+                return entry[1]
+
+        # The lock is not held across the request, so concurrent misses may both fetch
+        value = factory()
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
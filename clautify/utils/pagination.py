@@ -1,26 +1,83 @@
 """Generic Spotify API pagination helper."""
 
+import re
+import time
+from collections import deque
 from collections.abc import Generator
-from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Tuple
 
+from clautify.exceptions import ParentException
 
-def _traverse(data: Any, path: list[str]) -> Any:
-    """Walk a nested dict by key path."""
-    for key in path:
-        if isinstance(data, dict):
-            data = data.get(key)
-        else:
-            return None
+# Reduced page size each operation was found to accept, and when, so later paginations skip the probing
+_learned_limits: Dict[str, Tuple[int, float]] = {}
+# A learned size is trusted this long, then the full size is probed again in case the rejection was transient
+_LEARNED_LIMIT_TTL = 15 * 60
+_MIN_LIMIT = 10
+# Found in both resp.error.string ("Status Code: 400, Response: ...") and TLSClient._raise_on_fail messages
+_SIZE_REJECTED_RE = re.compile(r"\bStatus Code: (?:400|413)\b")
+
+
+def _traverse(data: Any, path: Tuple[str, ...]) -> Any:
+    """Walk a nested dict by key path, ``None`` if any level is missing."""
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, TypeError):
+        return None
     return data
 
 
-def paginate(
+def _size_rejected(e: ParentException) -> bool:
+    """Whether the API refused the request with 400/413, whichever way the caller worded the exception."""
+    return any(_SIZE_REJECTED_RE.search(text) for text in (e.error or "", str(e)))
+
+
+def _start_limit(key: str, upper_limit: int) -> int:
+    entry = _learned_limits.get(key)
+    if entry is None or entry[1] + _LEARNED_LIMIT_TTL <= time.monotonic():
+        return upper_limit
+    return min(upper_limit, entry[0])
+
+
+def _fetch_first_page(query_fn: Callable[[int, int], Any], upper_limit: int, key: str | None) -> Tuple[Any, int]:
+    """Fetch offset 0, halving the page size while the API rejects it as too large."""
+    start = _start_limit(key, upper_limit) if key else upper_limit
+    limit = start
+    while True:
+        try:
+            page = query_fn(limit, 0)
+        except ParentException as e:
+            if limit <= _MIN_LIMIT or not _size_rejected(e):
+                raise
+            limit = max(_MIN_LIMIT, limit // 2)
+            continue
+        if key:
+            if limit < start:
+                _learned_limits[key] = (limit, time.monotonic())
+            elif limit == upper_limit:
+                # The full size works (again); reusing a learned size keeps its original timestamp
+                _learned_limits.pop(key, None)
+        return page, limit
+
+
+def paginate_concurrent(
     query_fn: Callable[[int, int], Any],
     total_path: str,
     items_path: str,
     upper_limit: int,
+    max_concurrency: int = 8,
+    key: str | None = None,
 ) -> Generator[Any, None, None]:
-    """Generic pagination over Spotify API queries.
+    """Generic pagination over Spotify API queries, fetching pages concurrently.
+
+    The first page is fetched synchronously to learn the total count, which
+    also authenticates the client before any worker thread uses it. The
+    remaining offsets are then fetched through a sliding window of at most
+    ``max_concurrency`` requests and yielded in offset order. An error from
+    any page is raised when that page is reached; closing the generator
+    early cancels the pages not yet started.
 
     Args:
         query_fn: ``(limit, offset) -> response_dict``. Callers bind any
@@ -30,19 +87,33 @@ def paginate(
         items_path: Dot-separated key path to items in the response
             (e.g. ``"data.searchV2.tracksV2.items"``).
         upper_limit: Page size per request.
+        max_concurrency: Maximum number of in-flight page requests.
+        key: Operation name. When given, a page size rejected with 400/413
+            is halved and retried, and the accepted size is remembered for
+            ``_LEARNED_LIMIT_TTL`` seconds.
     """
-    total_keys = total_path.split(".")
-    items_keys = items_path.split(".")
+    total_keys = tuple(total_path.split("."))
+    items_keys = tuple(items_path.split("."))
 
-    first = query_fn(upper_limit, 0)
+    first, upper_limit = _fetch_first_page(query_fn, upper_limit, key)
     total_count = _traverse(first, total_keys) or 0
     yield _traverse(first, items_keys)
 
-    if total_count <= upper_limit:
+    offsets = range(upper_limit, total_count, upper_limit)
+    if not offsets:
         return
 
-    offset = upper_limit
-    while offset < total_count:
-        page = query_fn(upper_limit, offset)
-        yield _traverse(page, items_keys)
-        offset += upper_limit
+    pool = ThreadPoolExecutor(max_workers=min(max_concurrency, len(offsets)))
+    pending = iter(offsets)
+    # Sliding window in submission order: at most max_concurrency pages in flight or unconsumed
+    window: Deque[Future] = deque(pool.submit(query_fn, upper_limit, off) for off in islice(pending, max_concurrency))
+    try:
+        while window:
+            page = window.popleft().result()
+            offset = next(pending, None)
+            if offset is not None:
+                window.append(pool.submit(query_fn, upper_limit, offset))
+            yield _traverse(page, items_keys)
+    finally:
+        # Don't block on (or keep issuing) requests the caller no longer wants
+        pool.shutdown(wait=False, cancel_futures=True)
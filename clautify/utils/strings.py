@@ -1,10 +1,15 @@
-import ast
+import functools
 import os
-import random
 import re
-from typing import Dict, List, Tuple
+import secrets
+from typing import AnyStr, Dict, List, Tuple
 
-from bs4 import BeautifulSoup
+try:
+    from lxml import etree
+except ImportError:  # part of the "fast" extra; extract_js_links falls back to BeautifulSoup
+    etree = None
+
+from clautify._json import loads as _json_loads
 
 __all__ = [
     "extract_spotify_id",
@@ -14,6 +19,14 @@ __all__ = [
 ]
 
 
+# kind -> (URI prefix, URL path fragment, colon fragment)
+_ID_PREFIXES: Dict[str, Tuple[str, str, str]] = {
+    kind: (f"spotify:{kind}:", f"{kind}/", f"{kind}:")
+    for kind in ("track", "playlist", "album", "artist", "episode", "show")
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_spotify_id(identifier: str, kind: str) -> str:
     """Extract bare Spotify ID from a URI, URL, or pass through a bare ID.
 
@@ -22,27 +35,44 @@ def extract_spotify_id(identifier: str, kind: str) -> str:
     - ``https://open.spotify.com/track/abc123`` → ``abc123``
     - ``abc123`` → ``abc123``
     """
-    prefix = f"spotify:{kind}:"
-    if identifier.startswith(prefix):
-        return identifier[len(prefix) :]
-    if f"{kind}/" in identifier:
-        return identifier.split(f"{kind}/")[-1].split("?")[0]
-    if f"{kind}:" in identifier:
-        return identifier.split(f"{kind}:")[-1]
+    # Canonical base62 IDs are by far the most common input; isascii() matches the executor's _is_bare_id
+    if len(identifier) == 22 and identifier.isascii() and identifier.isalnum():
+        return identifier
+    uri_prefix, url_fragment, colon_fragment = _ID_PREFIXES.get(kind) or (
+        f"spotify:{kind}:",
+        f"{kind}/",
+        f"{kind}:",
+    )
+    if identifier.startswith(uri_prefix):
+        return identifier[len(uri_prefix) :]
+    if url_fragment in identifier:
+        return identifier.split(url_fragment)[-1].split("?")[0]
+    if colon_fragment in identifier:
+        return identifier.split(colon_fragment)[-1]
     return identifier
 
 
+_CHUNK_MAP_RE = re.compile(r"\{\d+:\"[^\"]+\"(?:,\d+:\"[^\"]+\")*\}")
+# A string literal (kept as is) or a bare integer key of a JS object literal (quoted to make it JSON)
+_JS_INT_KEY_RE = re.compile(r'("(?:[^"\\]|\\.)*")|([{,])(\d+):')
+
+
+def _quote_int_key(match: "re.Match[str]") -> str:
+    return match.group(1) or f'{match.group(2)}"{match.group(3)}":'
+
+
+def _parse_chunk_map(literal: str) -> Dict[int, str]:
+    return {int(k): v for k, v in _json_loads(_JS_INT_KEY_RE.sub(_quote_int_key, literal)).items()}
+
+
 def extract_mappings(js_code: str) -> Tuple[Dict[int, str], Dict[int, str]]:
-    pattern = r"\{\d+:\"[^\"]+\"(?:,\d+:\"[^\"]+\")*\}"
-    matches = re.findall(pattern, js_code)
+    matches = _CHUNK_MAP_RE.findall(js_code)
 
-    if len(matches) < 2:
+    # The chunk name and hash maps are the 4th and 5th such literals in the pack
+    if len(matches) < 5:
         raise ValueError("Could not find both mappings in the JS code.")
 
-    mapping1 = ast.literal_eval(matches[3])
-    mapping2 = ast.literal_eval(matches[4])
-
-    return mapping1, mapping2
+    return _parse_chunk_map(matches[3]), _parse_chunk_map(matches[4])
 
 
 def combine_chunks(name_map: Dict[int, str], hash_map: Dict[int, str]) -> List[str]:
@@ -54,8 +84,34 @@ def combine_chunks(name_map: Dict[int, str], hash_map: Dict[int, str]) -> List[s
     return combined
 
 
+class _ScriptCollector:
+    """lxml parser target that only records ``<script src="*.js">`` links."""
+
+    __slots__ = ("links",)
+
+    def __init__(self) -> None:
+        self.links: List[str] = []
+
+    def start(self, tag: str, attrs: Dict[str, str]) -> None:
+        if tag == "script":
+            src = attrs.get("src")
+            if src and src.endswith(".js"):
+                self.links.append(src)
+
+    def close(self) -> List[str]:
+        return self.links
+
+
 def extract_js_links(html_content: str) -> List[str]:
     """Extracts all JavaScript links from a given HTML content."""
+    if etree is not None:
+        parser = etree.HTMLParser(target=_ScriptCollector())
+        parser.feed(html_content)
+        return parser.close()
+
+    # Deferred: bs4 is slow to import and only needed here, on the fallback path
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html_content, "html.parser")
     js_links = []
 
@@ -75,18 +131,23 @@ def random_hex_string(length: int):
     return hex_string[:length]
 
 
-def parse_json_string(b: str, s: str) -> str:
-    start_index = b.find(f'{s}":"')
-    if start_index == -1:
-        raise ValueError(f'Substring "{s}":" not found in JSON string')
+@functools.lru_cache(maxsize=128)
+def _json_string_pattern(key: str, binary: bool) -> "re.Pattern":
+    pattern = rf'"{re.escape(key)}":"((?:[^"\\]|\\.)*)"'
+    return re.compile(pattern.encode() if binary else pattern)
+
 
-    value_start_index = start_index + len(s) + 3
-    value_end_index = b.find('"', value_start_index)
-    if value_end_index == -1:
-        raise ValueError(f'Closing double quote not found after "{s}":"')
+def parse_json_string(b: AnyStr, s: str) -> AnyStr:
+    """Return the raw (still escaped) string value of key ``s`` in a JSON/JS blob.
 
-    return b[value_start_index:value_end_index]
+    ``b`` may be ``bytes`` so callers can skip decoding large responses.
+    """
+    match = _json_string_pattern(s, isinstance(b, bytes)).search(b)
+    if match is None:
+        raise ValueError(f'Substring "{s}":" not found in JSON string')
+    return match.group(1)
 
 
 def random_nonce() -> str:
-    return "".join(str(random.getrandbits(32)) for _ in range(2))
+    # Same shape as the web player's nonce: two concatenated decimal uint32s
+    return f"{secrets.randbits(32)}{secrets.randbits(32)}"
@@ -1,14 +1,18 @@
 """Shared fixtures for clautify tests."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from clautify.dsl import SpotifySession
+from clautify.artist import Artist
+from clautify.dsl import SpotifySession, executor
+from clautify.player import Player
+from clautify.playlist import PrivatePlaylist
+from clautify.song import Song
 
 
 def _mock_player(**overrides):
-    p = MagicMock()
+    p = Mock(spec=Player)
     p.state = MagicMock()
     p.active_id = "dev0"
     p.device_id = "dev0"
@@ -26,19 +30,26 @@ def _mock_player(**overrides):
     return p
 
 
+# Names looked up from clautify.dsl.executor that the session fixture replaces
+_PATCHED = {
+    "Player": "Player",
+    "Song": "Song",
+    "Artist": "Artist",
+    "PP": "PrivatePlaylist",
+    "BaseClient": "BaseClient",
+}
+
+
 @pytest.fixture
-def session():
-    login = MagicMock()
-    with (
-        patch("clautify.dsl.executor.Player") as P,
-        patch("clautify.dsl.executor.Song") as S,
-        patch("clautify.dsl.executor.Artist") as A,
-        patch("clautify.dsl.executor.PrivatePlaylist") as PP,
-    ):
-        P.return_value = _mock_player()
-        S.return_value = MagicMock()
-        A.return_value = MagicMock()
-        PP.return_value = MagicMock()
-        s = SpotifySession(login, eager=False)
-        s._mocks = {"Player": P, "Song": S, "Artist": A, "PP": PP}
-        yield s
+def session(monkeypatch):
+    mocks = {key: MagicMock() for key in _PATCHED}
+    for key, name in _PATCHED.items():
+        monkeypatch.setattr(executor, name, mocks[key])
+    mocks["Player"].return_value = _mock_player()
+    # spec= so a call to a method the real class lacks fails the test
+    mocks["Song"].return_value = Mock(spec=Song)
+    mocks["Artist"].return_value = Mock(spec=Artist)
+    mocks["PP"].return_value = Mock(spec=PrivatePlaylist)
+    s = SpotifySession(MagicMock(), eager=False)
+    s._mocks = mocks
+    yield s
@@ -0,0 +1,82 @@
+"""Artist tests: library mutations and cached overviews.
+
+No network: requests go to a mock client or to a TLSClient whose transport is faked.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from clautify.artist import Artist
+from clautify.http.cache import ResponseCache
+from clautify.http.data import Response
+from clautify.http.request import TLSClient
+
+_IDS = ["4O15NlyKLIASxsJ0PrXPfz", "3TVXtAsR1Inumwj472S9r4", "0OdUWJ0sBjDrqHygGUXeCF"]
+
+
+@pytest.fixture
+def artist():
+    http = MagicMock()
+    http.client_identifier = "chrome_120"
+    http.post.return_value = Response(raw=MagicMock(), status_code=200, response={})
+    a = Artist(client=http)
+    a._login = True
+    a.base._hash_map = {"addToLibrary": "a" * 64, "removeFromLibrary": "b" * 64}
+    return a
+
+
+# ── Follow / unfollow ───────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("method, operation", [("follow_many", "addToLibrary"), ("unfollow_many", "removeFromLibrary")])
+def test_many_artists_go_in_one_request(artist, method, operation):
+    getattr(artist, method)(_IDS)
+    artist.base.client.post.assert_called_once()
+    payload = artist.base.client.post.call_args.kwargs["json"]
+    assert payload["operationName"] == operation
+    assert payload["variables"]["uris"] == [f"spotify:artist:{i}" for i in _IDS]
+
+
+def test_follow_requires_login(artist):
+    artist._login = False
+    with pytest.raises(ValueError, match="logged in"):
+        artist.follow_many(_IDS)
+    artist.base.client.post.assert_not_called()
+
+
+# ── Overview caching ────────────────────────────────────────────────
+
+
+class _FakeResponse:
+    status_code = 200
+    url = "https://api-partner.spotify.com/pathfinder/v1/query"
+
+    def __init__(self, body):
+        self.text = json.dumps(body)
+        self.headers = {"Cache-Control": "max-age=60"}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def test_repeated_overview_is_served_by_the_response_cache(monkeypatch):
+    client = TLSClient("chrome_120", "")
+    client.response_cache = ResponseCache()
+    sent = []
+
+    def execute_request(method, url, **kwargs):
+        sent.append(kwargs["params"]["operationName"])
+        return _FakeResponse({"data": {"artistUnion": {"profile": {"name": "Deafheaven"}}}})
+
+    monkeypatch.setattr(client, "execute_request", execute_request)
+    a = Artist(client=client)
+    a.base._hash_map = {"queryArtistOverview": "c" * 64}
+    a.base._auth_ready = True
+
+    first = a.get_artist(_IDS[0])
+    first["data"]["artistUnion"]["profile"]["name"] = "changed"
+    assert a.get_artist(_IDS[0])["data"]["artistUnion"]["profile"]["name"] == "Deafheaven"
+    assert sent == ["queryArtistOverview"]
+    client.close()
@@ -0,0 +1,222 @@
+"""BaseClient tests: persisted-query hash discovery and caching, token persistence, auth reset and client ownership.
+
+No network: the main client is a mock and the CDN sessions are replaced by a fake.
+"""
+
+import atexit
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import clautify.client as client_mod
+import clautify.http.request as request_mod
+from clautify.album import PublicAlbum
+from clautify.client import BaseClient, _TokenStore
+from clautify.exceptions import BaseClientError
+from clautify.http.data import Response
+from clautify.playlist import PublicPlaylist
+
+_CDN = "https://open.spotifycdn.com/cdn/build/web-player/"
+
+
+def _hash_literal(operation, digit):
+    return f'"{operation}","query","{digit * 64}"'
+
+
+# Three unrelated chunk literals, then the chunk hash map and the chunk name map
+_WEB_PLAYER_PACK = '{0:"x"}' * 3 + '{1:"h1",2:"h2"}{1:"album",2:"track"}' + _hash_literal("fetchPlaylist", "a")
+_CHUNKS = {
+    _CDN + "album.h1.js": _hash_literal("getAlbum", "b"),
+    _CDN + "track.h2.js": _hash_literal("getTrack", "c"),
+}
+
+
+class _FakeSession:
+    instances = []
+
+    def __init__(self, client_identifier, random_tls_extension_order):
+        self.headers = {}
+        self.proxies = {}
+        self.closed = False
+        _FakeSession.instances.append(self)
+
+    def get(self, url):
+        resp = MagicMock()
+        resp.status_code = 200 if url in _CHUNKS else 500
+        resp.text = _CHUNKS.get(url, "")
+        return resp
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def base(monkeypatch, tmp_path):
+    monkeypatch.setattr(client_mod, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(client_mod, "Session", _FakeSession)
+    _FakeSession.instances = []
+    http = MagicMock()
+    http.client_identifier = "chrome_120"
+    http.proxies = {}
+    http.cookies = {}
+    http.auto_retries = 1
+    http.get.return_value = Response(raw=MagicMock(), status_code=200, response=_WEB_PLAYER_PACK)
+    b = BaseClient(http)
+    b.js_pack = "https://open.spotifycdn.com/cdn/build/web-player/web-player.js"
+    b.client_version = "1.2.3"
+    return b
+
+
+# ── Hash discovery ──────────────────────────────────────────────────
+
+
+def test_sha256_hash_merges_pack_and_chunks(base):
+    base.get_sha256_hash()
+    assert base._hash_map == {"fetchPlaylist": "a" * 64, "getAlbum": "b" * 64, "getTrack": "c" * 64}
+    # Only the web-player pack goes through the authenticated client
+    base.client.get.assert_called_once_with(base.js_pack)
+    assert _FakeSession.instances and all(s.closed for s in _FakeSession.instances)
+
+
+def test_sha256_hash_chunk_failure_raises(base, monkeypatch):
+    monkeypatch.delitem(_CHUNKS, _CDN + "track.h2.js")
+    with pytest.raises(BaseClientError, match="general hashes"):
+        base.get_sha256_hash()
+    assert base._hash_map == {}
+    assert all(s.closed for s in _FakeSession.instances)
+
+
+def test_save_hash_cache_keeps_other_recent_versions(base, tmp_path):
+    recent = tmp_path / "hashes-1.0.0.json"
+    old = tmp_path / "hashes-0.9.0.json"
+    recent.write_text("{}")
+    old.write_text("{}")
+    stale = time.time() - client_mod._HASH_CACHE_MAX_AGE - 60
+    os.utime(old, (stale, stale))
+
+    client_mod._save_hash_cache("1.2.3", {"getAlbum": "b" * 64})
+    assert recent.exists()
+    assert not old.exists()
+    assert client_mod._load_hash_cache("1.2.3") == {"getAlbum": "b" * 64}
+
+
+def test_cached_hashes_skip_the_download(base):
+    client_mod._save_hash_cache("1.2.3", {"getAlbum": "b" * 64})
+    assert base.part_hash("getAlbum") == "b" * 64
+    base.client.get.assert_not_called()
+
+
+def test_loading_hashes_marks_file_as_used(base, tmp_path):
+    client_mod._save_hash_cache("1.2.3", {"getAlbum": "b" * 64})
+    path = tmp_path / "hashes-1.2.3.json"
+    stale = time.time() - client_mod._HASH_CACHE_MAX_AGE - 60
+    os.utime(path, (stale, stale))
+    client_mod._load_hash_cache("1.2.3")
+    client_mod._save_hash_cache("2.0.0", {})
+    assert path.exists()
+
+
+# ── Token persistence ───────────────────────────────────────────────
+
+
+def _with_tokens(base, access_ttl=3600, client_ttl=1209600):
+    base.access_token = "access"
+    base.client_token = "client"
+    base.client_id = "cid"
+    base.access_token_expires_at = time.time() + access_ttl
+    base.client_token_expires_at = time.time() + client_ttl
+    return base
+
+
+def test_tokens_round_trip_with_both_expiries(base):
+    _with_tokens(base)._save_cached_tokens()
+    fresh = BaseClient(base.client)
+    kwargs = fresh._auth_rule({})
+    assert kwargs["headers"]["Authorization"] == "Bearer access"
+    assert kwargs["headers"]["Client-Token"] == "client"
+    assert fresh.access_token_expires_at == base.access_token_expires_at
+    assert fresh.client_token_expires_at == base.client_token_expires_at
+    # Served from disk without the handshake
+    base.client.get.assert_not_called()
+    base.client.post.assert_not_called()
+
+
+def test_token_file_is_private(base):
+    _with_tokens(base)._save_cached_tokens()
+    assert _TokenStore.path(base.client).stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize(
+    "access_ttl, client_ttl",
+    [(30, 1209600), (3600, 30), (-10, 1209600)],
+    ids=["access-within-margin", "client-within-margin", "access-expired"],
+)
+def test_token_entry_expiring_soon_is_ignored(base, access_ttl, client_ttl):
+    _with_tokens(base, access_ttl, client_ttl)._save_cached_tokens()
+    assert _TokenStore.load(base.client) is None
+
+
+def test_old_format_entry_is_ignored(base):
+    path = _TokenStore.path(base.client)
+    path.write_text(json.dumps({"access_token": "a", "client_token": "c", "expires_at": time.time() + 3600}))
+    assert _TokenStore.load(base.client) is None
+
+
+def test_tokens_without_expiry_are_not_saved(base):
+    _with_tokens(base).client_token_expires_at = 0
+    base._save_cached_tokens()
+    assert not _TokenStore.path(base.client).exists()
+
+
+def test_tokens_are_keyed_on_sp_dc(base):
+    anonymous = _TokenStore.path(base.client)
+    base.client.cookies = {"sp_dc": "someone"}
+    assert _TokenStore.path(base.client) != anonymous
+
+
+def test_reset_auth_drops_token_file(base):
+    _with_tokens(base)._save_cached_tokens()
+    base._reset_auth()
+    assert not _TokenStore.path(base.client).exists()
+
+
+# ── Auth reset ──────────────────────────────────────────────────────
+
+
+def test_reset_auth_ignores_already_replaced_token(base):
+    base.access_token = "new"
+    base._auth_headers["Authorization"] = "Bearer new"
+    base._auth_ready = True
+    base._reset_auth("Bearer old")
+    assert base._auth_ready and base.access_token == "new"
+    base._reset_auth("Bearer new")
+    assert not base._auth_ready
+
+
+# ── Client ownership ────────────────────────────────────────────────
+
+
+def test_objects_without_a_client_share_one_transport():
+    english = PublicAlbum("4gU4dpg8w3eAmbU6DJnl6W")
+    korean = PublicAlbum("4gU4dpg8w3eAmbU6DJnl6W", language="ko")
+    assert english.base.client is not korean.base.client
+    # Each BaseClient's hooks stay on its own client
+    assert english.base.client.on_auth_failure == english.base._reset_auth
+    assert korean.base.client.on_auth_failure == korean.base._reset_auth
+    # ...while requests go over the same native session
+    assert english.base.client._session_id == korean.base.client._session_id
+
+
+def test_objects_without_a_client_register_no_exit_hooks():
+    PublicAlbum("4gU4dpg8w3eAmbU6DJnl6W")  # creates the shared transport if no earlier test did
+    before = atexit._ncallbacks()
+    albums = [PublicAlbum("4gU4dpg8w3eAmbU6DJnl6W") for _ in range(20)]
+    playlists = [PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M") for _ in range(20)]
+    assert atexit._ncallbacks() == before
+    # Closing one leaves the shared session open for the rest
+    albums[0].base.close()
+    assert request_mod._default_transport._owns_session
+    assert playlists[0].base.client._session_id == request_mod._default_transport._session_id
@@ -5,12 +5,19 @@ Executor tests verify resolution and dispatch via session.run().
 The session fixture lives in conftest.py.
 """
 
-from unittest.mock import MagicMock
+import threading
+import time
+from collections import Counter
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from clautify.dsl.executor import DSLError
+import clautify.client as client_mod
+from clautify.client import BaseClient
+from clautify.dsl.executor import DSLError, SpotifyExecutor, _is_bare_id
 from clautify.dsl.parser import parse
+from clautify.http.data import Response
+from clautify.song import Song
 
 # ── Stub helpers (executor tests only) ─────────────────────────────
 
@@ -93,23 +100,15 @@ class TestParserPlayback:
         [
             ("pause", {"action": "pause"}),
             ("resume", {"action": "resume"}),
+            ("skip", {"action": "skip", "n": 1}),
+            ("skip 3", {"action": "skip", "n": 3}),
+            ("seek 30000", {"action": "seek", "position_s": 30000.0}),
         ],
+        ids=["pause", "resume", "skip-default", "skip-n", "seek"],
     )
     def test_simple_actions(self, cmd, expected):
         assert parse(cmd) == expected
 
-    def test_skip_default(self):
-        r = parse("skip")
-        assert r == {"action": "skip", "n": 1}
-
-    def test_skip_n(self):
-        r = parse("skip 3")
-        assert r == {"action": "skip", "n": 3}
-
-    def test_seek(self):
-        r = parse("seek 30000")
-        assert r == {"action": "seek", "position_s": 30000.0}
-
     def test_queue_single(self):
         r = parse("queue track 6rqhFgbbKwnb9MLmUQDhG6")
         assert r["action"] == "queue"
@@ -244,34 +243,35 @@ class TestParserLibrary:
 class TestParserStatus:
     """status parses as a simple query."""
 
-    def test_status(self):
-        r = parse("status")
-        assert r == {"query": "status"}
-
-    def test_status_with_limit(self):
-        r = parse("status limit 3")
-        assert r == {"query": "status", "limit": 3}
+    @pytest.mark.parametrize(
+        "cmd, expected",
+        [
+            ("status", {"query": "status"}),
+            ("status limit 3", {"query": "status", "limit": 3}),
+        ],
+        ids=["bare", "with-limit"],
+    )
+    def test_status(self, cmd, expected):
+        assert parse(cmd) == expected
 
 
 class TestParserStateModifiers:
     """volume, mode, on — standalone or chained."""
 
-    def test_volume_absolute(self):
-        r = parse("volume 50")
-        assert r == {"action": "set", "volume": 50}
-
-    def test_volume_relative(self):
-        r = parse("volume +10")
-        assert r == {"action": "set", "volume_rel": 10}
-
-    @pytest.mark.parametrize("mode", ["shuffle", "repeat", "normal"])
-    def test_mode(self, mode):
-        r = parse(f"mode {mode}")
-        assert r == {"action": "set", "mode": mode}
-
-    def test_device_switch(self):
-        r = parse('device "MacBook Pro"')
-        assert r == {"action": "set", "device": "MacBook Pro"}
+    @pytest.mark.parametrize(
+        "cmd, expected",
+        [
+            ("volume 50", {"action": "set", "volume": 50}),
+            ("volume +10", {"action": "set", "volume_rel": 10}),
+            ("mode shuffle", {"action": "set", "mode": "shuffle"}),
+            ("mode repeat", {"action": "set", "mode": "repeat"}),
+            ("mode normal", {"action": "set", "mode": "normal"}),
+            ('device "MacBook Pro"', {"action": "set", "device": "MacBook Pro"}),
+        ],
+        ids=["volume-absolute", "volume-relative", "mode-shuffle", "mode-repeat", "mode-normal", "device"],
+    )
+    def test_standalone_modifier(self, cmd, expected):
+        assert parse(cmd) == expected
 
     def test_play_with_modifiers(self):
         r = parse('play track "Heathen" volume 50 mode shuffle')
@@ -350,6 +350,29 @@ class TestResolveQuotedString:
         with pytest.raises(DSLError, match="No results"):
             session.run('play track "xyznonexistent"')
 
+    def test_repeated_name_searches_once(self, session):
+        _stub_track_search(session)
+        session.run('play track "Heathen"')
+        session.run('queue track "heathen"')
+        assert session._mocks["Song"].return_value.query_songs.call_count == 1
+
+    def test_queue_multiple_names_keeps_order(self, session):
+        def search(name, limit=10):
+            uri = f"spotify:track:{name}"
+            return {"data": {"searchV2": {"tracksV2": {"items": [{"item": {"data": {"name": name, "uri": uri}}}]}}}}
+
+        session._mocks["Song"].return_value.query_songs.side_effect = search
+        session.run('queue track "a" "b" 6rqhFgbbKwnb9MLmUQDhG6 "c"')
+        queued = [c.args[0] for c in session._mocks["Player"].return_value.add_to_queue.call_args_list]
+        assert queued == [f"spotify:track:{t}" for t in ("a", "b", "6rqhFgbbKwnb9MLmUQDhG6", "c")]
+
+    def test_clear_resolve_cache_searches_again(self, session):
+        _stub_track_search(session)
+        session.run('play track "Heathen"')
+        session._executor.clear_resolve_cache()
+        session.run('play track "Heathen"')
+        assert session._mocks["Song"].return_value.query_songs.call_count == 2
+
 
 class TestResolveBareId:
     """Bare IDs should be used directly — no search."""
@@ -369,6 +392,54 @@ class TestResolveBareId:
         session._mocks["Song"].return_value.query_songs.assert_not_called()
         session._mocks["Artist"].return_value.query_artists.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "target, expected",
+        [
+            ("6rqhFgbbKwnb9MLmUQDhG6", True),
+            ("6rqhFgbbKwnb9MLmUQDhG", False),
+            ("6rqhFgbbKwnb9MLmUQDhG6x", False),
+            ("6rqhFgbbKwnb9MLmUQD_G6", False),
+            ("6rqhFgbbKwnb9MLmUQDhGé", False),
+            ("6rqhFgbbKwnb9MLmUQDhG6\n", False),
+        ],
+        ids=["valid", "too-short", "too-long", "underscore", "non-ascii", "trailing-newline"],
+    )
+    def test_is_bare_id(self, target, expected):
+        assert _is_bare_id(target) is expected
+
+
+class TestInfoQuery:
+    """info kind ID dispatches to the matching API class."""
+
+    @pytest.mark.parametrize(
+        "kind, mock_key, method",
+        [
+            ("track", "Song", "get_track_info"),
+            ("artist", "Artist", "get_artist"),
+        ],
+    )
+    def test_info_logged_in_api(self, session, kind, mock_key, method):
+        api = getattr(session._mocks[mock_key].return_value, method)
+        r = session.run(f"info {kind} 6rqhFgbbKwnb9MLmUQDhG6")
+        assert r["data"] is api.return_value
+        api.assert_called_once_with("6rqhFgbbKwnb9MLmUQDhG6")
+
+    @pytest.mark.parametrize(
+        "kind, cls_name, method",
+        [
+            ("album", "PublicAlbum", "get_album_info"),
+            ("playlist", "PublicPlaylist", "get_playlist_info"),
+        ],
+    )
+    def test_info_public_api(self, session, monkeypatch, kind, cls_name, method):
+        cls = MagicMock()
+        monkeypatch.setattr(f"clautify.dsl.executor.{cls_name}", cls)
+        r = session.run(f"info {kind} 6rqhFgbbKwnb9MLmUQDhG6 limit 5")
+        api = getattr(cls.return_value, method)
+        assert r["data"] is api.return_value
+        cls.assert_called_once_with("6rqhFgbbKwnb9MLmUQDhG6")
+        api.assert_called_once_with(limit=5, offset=0)
+
 
 class TestSearchArtistAutoInfo:
     """search artist with exact name match returns info instead of ID list."""
@@ -404,8 +475,8 @@ class TestLibraryExecution:
         [
             ("add", "track", _stub_track_search, "Song", "like_song"),
             ("remove", "track", _stub_track_search, "Song", "unlike_song"),
-            ("add", "artist", _stub_artist_search, "Artist", "follow"),
-            ("remove", "artist", _stub_artist_search, "Artist", "unfollow"),
+            ("add", "artist", _stub_artist_search, "Artist", "follow_many"),
+            ("remove", "artist", _stub_artist_search, "Artist", "unfollow_many"),
         ],
     )
     def test_library_track_artist(self, session, action, kind, stub_fn, mock_key, method):
@@ -426,6 +497,24 @@ class TestLibraryExecution:
         assert r["status"] == "ok"
         getattr(session._mocks["PP"].return_value, method).assert_called_once()
 
+    @pytest.mark.parametrize("action, method", [("add", "follow_many"), ("remove", "unfollow_many")])
+    def test_many_artists_share_one_call(self, session, action, method):
+        r = session.run(f"library {action} artist 4O15NlyKLIASxsJ0PrXPfz 3TVXtAsR1Inumwj472S9r4")
+        assert r["status"] == "ok"
+        artist = session._mocks["Artist"].return_value
+        getattr(artist, method).assert_called_once_with(["4O15NlyKLIASxsJ0PrXPfz", "3TVXtAsR1Inumwj472S9r4"])
+        artist.follow.assert_not_called()
+        artist.unfollow.assert_not_called()
+
+    def test_playlist_context_reuses_song(self, session):
+        cmd = "library add track 6rqhFgbbKwnb9MLmUQDhG6 in playlist 37i9dQZF1DXcBWIGoYBM5M"
+        session.run(cmd)
+        session.run(cmd)
+        song = session._mocks["Song"].return_value
+        session._mocks["Song"].assert_called_once()
+        assert song.add_song_to_playlist.call_count == 2
+        song.add_song_to_playlist.assert_called_with("6rqhFgbbKwnb9MLmUQDhG6")
+
 
 class TestStatusQuery:
     """status returns now_playing, queue, devices, history in one call."""
@@ -443,3 +532,72 @@ class TestStatusQuery:
         r = session.run("status limit 2")
         assert r["status"] == "ok"
         assert r["limit"] == 2
+
+
+class TestDispatch:
+    """Handlers are looked up on the instance, so patches and overrides apply."""
+
+    def test_patched_query_handler_is_called(self, session):
+        with patch.object(session._executor, "_query_status", return_value={"status": "patched"}) as handler:
+            assert session.run("status") == {"status": "patched"}
+        handler.assert_called_once()
+
+    def test_subclass_override_is_called(self, session):
+        class Quiet(SpotifyExecutor):
+            def _action_skip(self, cmd):
+                return {"status": "ok", "action": "skip", "quiet": True}
+
+        session._executor.__class__ = Quiet
+        assert session.run("skip")["quiet"] is True
+
+
+class TestColdFanOut:
+    """Concurrent searches on a cold client load the session, tokens and hashes once."""
+
+    @pytest.fixture
+    def fetches(self, session, monkeypatch, tmp_path):
+        monkeypatch.setattr(client_mod, "_CACHE_DIR", tmp_path)
+        counts = Counter()
+        lock = threading.Lock()
+
+        def counted(name, setup):
+            def fake(self):
+                with lock:
+                    counts[name] += 1
+                time.sleep(0.02)  # widen the window in which other threads find the client cold
+                setup(self)
+
+            monkeypatch.setattr(BaseClient, name, fake)
+
+        def session_page(base):
+            base.js_pack = "https://open.spotifycdn.com/cdn/build/web-player/web-player.js"
+            base.access_token = "access"
+
+        counted("get_session", session_page)
+        counted("get_client_token", lambda base: setattr(base, "client_token", "client"))
+        counted("get_sha256_hash", lambda base: setattr(base, "_hash_map", {"searchDesktop": "d" * 64}))
+
+        http = MagicMock()
+        http.client_identifier = "chrome_120"
+        http.cookies = {}
+
+        def post(url, **kwargs):
+            http.authenticate({"headers": {}})
+            term = kwargs["params"]["variables"]
+            items = [{"item": {"data": {"name": term, "uri": f"spotify:track:{term}"}}}]
+            body = {"data": {"searchV2": {"tracksV2": {"items": items}}}}
+            return Response(raw=MagicMock(), status_code=200, response=body)
+
+        http.post.side_effect = post
+        session._mocks["Song"].return_value = Song(client=http)
+        return counts
+
+    def test_resolving_many_names_warms_once(self, session, fetches):
+        r = session.run('queue track "A" "B" "C" "D" "E" "F" "G" "H"')
+        assert r["targets"] == list("ABCDEFGH")
+        assert fetches == {"get_session": 1, "get_client_token": 1, "get_sha256_hash": 1}
+
+    def test_multi_term_search_warms_once(self, session, fetches):
+        r = session.run('search track "A" "B" "C" "D" "E" "F" "G" "H"')
+        assert len(r["data"]) == 8
+        assert fetches == {"get_session": 1, "get_client_token": 1, "get_sha256_hash": 1}
@@ -0,0 +1,239 @@
+"""HTTP layer tests: client lifecycle, response cache and rate limiting.
+
+Requests never leave the process; TLSClient.execute_request is replaced by a fake server.
+"""
+
+import atexit
+import gc
+import json
+import weakref
+
+import pytest
+
+import clautify.http.request as request_mod
+from clautify.http import ratelimit
+from clautify.http.cache import ResponseCache
+from clautify.http.ratelimit import MAX_RETRY_AFTER, HostRateLimiter, TokenBucket, parse_retry_after
+from clautify.http.request import StdClient, TLSClient
+
+_QUERY_URL = "https://api-partner.spotify.com/pathfinder/v1/query"
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body, headers=None, url=_QUERY_URL):
+        self.status_code = status_code
+        self.text = json.dumps(body) if body is not None else ""
+        self.headers = headers or {}
+        self.url = url
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    c = TLSClient("chrome_120", "")
+    c.rate_limiter = None
+    c.response_cache = ResponseCache()
+    c.sent = []
+    c.replies = []
+
+    def execute_request(method, url, **kwargs):
+        c.sent.append((method, url, kwargs))
+        return c.replies.pop(0)
+
+    monkeypatch.setattr(c, "execute_request", execute_request)
+    return c
+
+
+def _album_params(uri="spotify:album:abc"):
+    return {"operationName": "getAlbum", "variables": json.dumps({"uri": uri})}
+
+
+# ── Lifecycle ───────────────────────────────────────────────────────
+
+
+def test_close_releases_the_exit_hook():
+    before = atexit._ncallbacks()
+    c = TLSClient("chrome_120", "")
+    assert atexit._ncallbacks() == before + 1
+    # atexit._ncallbacks() never shrinks (unregister blanks the slot), so check the hook no longer holds the client
+    ref = weakref.ref(c)
+    c.close()
+    del c
+    gc.collect()
+    assert ref() is None
+
+
+def test_std_client_close_releases_the_exit_hook():
+    c = StdClient()
+    ref = weakref.ref(c._client)
+    c.close()
+    del c
+    gc.collect()
+    assert ref() is None
+
+
+# ── Response cache ──────────────────────────────────────────────────
+
+
+def test_fresh_entry_served_without_request(client):
+    client.replies = [_FakeResponse(200, {"name": "Sunbather"}, {"Cache-Control": "max-age=60"})]
+    first = client.post(_QUERY_URL, params=_album_params(), authenticate=True)
+    second = client.post(_QUERY_URL, params=_album_params(), authenticate=True)
+    assert len(client.sent) == 1
+    assert second.response == first.response == {"name": "Sunbather"}
+
+
+def test_cached_response_is_a_copy(client):
+    client.replies = [_FakeResponse(200, {"tracks": [1]}, {"Cache-Control": "max-age=60"})]
+    client.get(_QUERY_URL, authenticate=True).response["tracks"].append(2)
+    assert client.get(_QUERY_URL, authenticate=True).response == {"tracks": [1]}
+
+
+def test_stale_entry_revalidates_with_etag(client):
+    client.replies = [
+        _FakeResponse(200, {"name": "Sunbather"}, {"ETag": '"v1"'}),
+        _FakeResponse(304, None),
+    ]
+    client.get(_QUERY_URL, authenticate=True)
+    r = client.get(_QUERY_URL, authenticate=True)
+    assert client.sent[1][2]["headers"]["If-None-Match"] == '"v1"'
+    assert r.status_code == 200
+    assert r.response == {"name": "Sunbather"}
+
+
+def test_invalidate_drops_matching_entries(client):
+    client.replies = [
+        _FakeResponse(200, {"v": 1}, {"Cache-Control": "max-age=60"}),
+        _FakeResponse(200, {"v": 2}, {"Cache-Control": "max-age=60"}),
+    ]
+    client.post(_QUERY_URL, params=_album_params(), authenticate=True)
+    client.response_cache.invalidate("spotify:album:abc")
+    r = client.post(_QUERY_URL, params=_album_params(), authenticate=True)
+    assert len(client.sent) == 2
+    assert r.response == {"v": 2}
+
+
+def test_mutation_bypasses_cache(client):
+    payload = {"operationName": "addToPlaylist", "variables": {"uris": ["spotify:track:abc"]}}
+    client.replies = [
+        _FakeResponse(200, {"ok": True}, {"Cache-Control": "max-age=60", "ETag": '"v1"'}),
+        _FakeResponse(200, {"ok": True}, {"Cache-Control": "max-age=60", "ETag": '"v1"'}),
+    ]
+    client.post(_QUERY_URL, json=payload, authenticate=True)
+    client.post(_QUERY_URL, json=payload, authenticate=True)
+    assert len(client.sent) == 2
+    assert "If-None-Match" not in (client.sent[1][2].get("headers") or {})
+
+
+def test_player_put_bypasses_cache(client):
+    client.replies = [_FakeResponse(200, {}, {"Cache-Control": "max-age=60"}) for _ in range(2)]
+    client.put(_QUERY_URL, json={"volume": 1}, authenticate=True)
+    client.put(_QUERY_URL, json={"volume": 1}, authenticate=True)
+    assert len(client.sent) == 2
+
+
+def test_language_is_part_of_the_key(client):
+    client.replies = [
+        _FakeResponse(200, {"name": "Album"}, {"Cache-Control": "max-age=60"}),
+        _FakeResponse(200, {"name": "앨범"}, {"Cache-Control": "max-age=60"}),
+    ]
+    en = client.post(_QUERY_URL, params=_album_params(), headers={"Accept-Language": "en"}, authenticate=True)
+    ko = client.post(_QUERY_URL, params=_album_params(), headers={"Accept-Language": "ko"}, authenticate=True)
+    assert len(client.sent) == 2
+    assert (en.response["name"], ko.response["name"]) == ("Album", "앨범")
+
+
+# ── Rate limiting ───────────────────────────────────────────────────
+
+
+class _FakeClock:
+    """Stands in for the time module: sleep() only advances monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    monkeypatch.setattr(request_mod, "time", fake)
+    return fake
+
+
+def test_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    assert clock.slept == [pytest.approx(0.1)]
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 0.2
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+
+
+def test_bucket_pause_holds_tokens_back(clock):
+    bucket = TokenBucket(rate=10, burst=20)
+    bucket.pause(3)
+    bucket.acquire()
+    assert sum(clock.slept) == pytest.approx(3)
+
+
+def test_limiter_keeps_one_bucket_per_host():
+    limiter = HostRateLimiter()
+    a = limiter.bucket("https://api-partner.spotify.com/pathfinder/v1/query")
+    assert limiter.bucket("https://api-partner.spotify.com/other") is a
+    assert limiter.bucket("https://gue1-spclient.spotify.com/x") is not a
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, 1.0),
+        ("", 1.0),
+        ("5", 5.0),
+        ("0.5", 0.5),
+        ("-3", 0.0),
+        ("9999", MAX_RETRY_AFTER),
+        ("soon", 1.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 1.0),
+    ],
+    ids=["missing", "empty", "seconds", "fraction", "negative", "clamped", "garbage", "http-date"],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_429_waits_out_retry_after(client, clock):
+    client.auto_retries = 2
+    client.rate_limiter = HostRateLimiter()
+    client.replies = [_FakeResponse(429, {}, {"Retry-After": "2"}), _FakeResponse(200, {"ok": True})]
+    r = client.put(_QUERY_URL, json={}, authenticate=True)
+    assert r.status_code == 200
+    assert len(client.sent) == 2
+    assert sum(clock.slept) == pytest.approx(2, abs=0.1)
+
+
+def test_429_without_limiter_sleeps(client, clock):
+    client.auto_retries = 2
+    client.replies = [_FakeResponse(429, {}, {"Retry-After": "120"}), _FakeResponse(200, {})]
+    client.put(_QUERY_URL, json={}, authenticate=True)
+    assert clock.slept == [MAX_RETRY_AFTER]
@@ -0,0 +1,197 @@
+"""Pagination helper tests: ordering, windowing, cancellation and page-size learning.
+
+Driven by fake ``query_fn`` callables instead of API calls. Concurrency is asserted with barriers
+and events, and window bookkeeping with an inline executor, rather than with sleeps.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from clautify.exceptions import AlbumError, ParentException
+from clautify.utils import pagination
+from clautify.utils.pagination import paginate_concurrent
+
+
+def _pages(total, *, fail_at=None):
+    """query_fn over ``total`` items whose page body is the offset it was asked for."""
+    calls = []
+    lock = threading.Lock()
+
+    def query_fn(limit, offset):
+        with lock:
+            calls.append(offset)
+        if offset == fail_at:
+            raise ParentException("page failed")
+        return {"data": {"total": total, "items": [offset]}}
+
+    return query_fn, calls
+
+
+def _paginate(query_fn, limit=10, max_concurrency=4):
+    return paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=limit, max_concurrency=max_concurrency)
+
+
+class _InlineExecutor:
+    """ThreadPoolExecutor stand-in that runs each page at submit time, so submissions can be counted exactly."""
+
+    instances = []
+
+    def __init__(self, max_workers):
+        self.shutdown_calls = []
+        _InlineExecutor.instances.append(self)
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdown_calls.append((wait, cancel_futures))
+
+
+@pytest.fixture
+def inline(monkeypatch):
+    monkeypatch.setattr(pagination, "ThreadPoolExecutor", _InlineExecutor)
+    _InlineExecutor.instances = []
+
+
+# ── Ordering and concurrency ────────────────────────────────────────
+
+
+def test_pages_yield_in_offset_order_while_completing_in_reverse():
+    """Four pages run at once and finish last-first; they still come out in offset order."""
+    total, window = 50, 4
+    done = {offset: threading.Event() for offset in range(10, total, 10)}
+    all_in_flight = threading.Barrier(window, timeout=5)
+    in_flight = max_in_flight = 0
+    lock = threading.Lock()
+
+    def query_fn(limit, offset):
+        nonlocal in_flight, max_in_flight
+        if offset:
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            all_in_flight.wait()
+            # Each page waits for the one after it, so completion order is reversed
+            if offset + 10 < total:
+                assert done[offset + 10].wait(timeout=5)
+            with lock:
+                in_flight -= 1
+            done[offset].set()
+        return {"data": {"total": total, "items": [offset]}}
+
+    assert [page[0] for page in _paginate(query_fn, max_concurrency=window)] == [0, 10, 20, 30, 40]
+    assert max_in_flight == window
+
+
+def test_single_page_spawns_no_workers(inline):
+    query_fn, calls = _pages(5)
+    assert list(_paginate(query_fn)) == [[0]]
+    assert calls == [0]
+    assert _InlineExecutor.instances == []
+
+
+# ── Sliding window ──────────────────────────────────────────────────
+
+
+def test_window_bounds_requests_ahead_of_consumer(inline):
+    query_fn, calls = _pages(1000)
+    gen = _paginate(query_fn, max_concurrency=3)
+    next(gen)  # first page, fetched synchronously
+    next(gen)
+    # First page, the initial window of 3, and one refill
+    assert calls == [0, 10, 20, 30, 40]
+    gen.close()
+
+
+def test_close_stops_issuing_and_cancels_pending_pages(inline):
+    query_fn, calls = _pages(1000)
+    gen = _paginate(query_fn, max_concurrency=2)
+    next(gen)
+    next(gen)
+    gen.close()
+    assert calls == [0, 10, 20, 30]
+    (pool,) = _InlineExecutor.instances
+    assert pool.shutdown_calls == [(False, True)]
+
+
+# ── Errors ──────────────────────────────────────────────────────────
+
+
+def test_page_error_raises_when_reached():
+    query_fn, _ = _pages(100, fail_at=50)
+    seen = []
+    with pytest.raises(ParentException, match="page failed"):
+        for page in _paginate(query_fn):
+            seen.append(page[0])
+    assert seen == [0, 10, 20, 30, 40]
+
+
+# ── Page size learning ──────────────────────────────────────────────
+
+
+@pytest.fixture
+def learned(monkeypatch):
+    limits = {}
+    monkeypatch.setattr(pagination, "_learned_limits", limits)
+    return limits
+
+
+def _size_capped(cap, exc):
+    """query_fn that rejects pages larger than ``cap`` with ``exc``."""
+    limits = []
+
+    def query_fn(limit, offset):
+        limits.append(limit)
+        if limit > cap:
+            raise exc
+        return {"data": {"total": 1, "items": [offset]}}
+
+    return query_fn, limits
+
+
+_ERROR_STRING = AlbumError("Could not get album info", error="Status Code: 400, Response: {}")
+_RAISE_ON_FAIL = AlbumError("Could not GET https://api/x. Status Code: 413", "Request Failed.")
+
+
+@pytest.mark.parametrize("exc", [_ERROR_STRING, _RAISE_ON_FAIL], ids=["error-string", "raise-on-fail"])
+def test_rejected_size_is_halved_and_remembered(learned, exc):
+    query_fn, limits = _size_capped(60, exc)
+    list(paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=200, key="getAlbum"))
+    assert limits == [200, 100, 50]
+    assert learned["getAlbum"][0] == 50
+
+    limits.clear()
+    list(paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=200, key="getAlbum"))
+    assert limits == [50]
+
+
+def test_learned_size_expires(learned):
+    query_fn, limits = _size_capped(1000, _ERROR_STRING)
+    learned["getAlbum"] = (50, time.monotonic() - pagination._LEARNED_LIMIT_TTL - 1)
+    list(paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=200, key="getAlbum"))
+    assert limits == [200]
+    assert "getAlbum" not in learned
+
+
+def test_reusing_learned_size_keeps_its_timestamp(learned):
+    query_fn, _ = _size_capped(60, _ERROR_STRING)
+    learned_at = time.monotonic() - 60
+    learned["getAlbum"] = (50, learned_at)
+    list(paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=200, key="getAlbum"))
+    assert learned["getAlbum"] == (50, learned_at)
+
+
+def test_other_errors_are_not_retried(learned):
+    query_fn, limits = _size_capped(60, AlbumError("Could not get album info", error="Status Code: 500, Response: {}"))
+    with pytest.raises(AlbumError):
+        list(paginate_concurrent(query_fn, "data.total", "data.items", upper_limit=200, key="getAlbum"))
+    assert limits == [200]
+    assert learned == {}
@@ -4,7 +4,8 @@ Resolution, dispatch, and parser shape are tested in test_dsl_v4.py.
 The session fixture lives in conftest.py.
 """
 
-from unittest.mock import MagicMock
+import json
+from unittest.mock import PropertyMock
 
 import pytest
 
@@ -56,10 +57,21 @@ def test_volume_out_of_range(session):
         session.run("volume 150")
 
 
-def test_mode(session):
-    r = session.run("mode shuffle")
+@pytest.mark.parametrize(
+    "mode, shuffle, repeat",
+    [
+        ("shuffle", True, False),
+        ("repeat", False, True),
+        ("normal", False, False),
+    ],
+)
+def test_mode(session, mode, shuffle, repeat):
+    r = session.run(f"mode {mode}")
     assert r["status"] == "ok"
-    assert r["mode"] == "shuffle"
+    assert r["mode"] == mode
+    player = session._mocks["Player"].return_value
+    player.set_shuffle.assert_called_once_with(shuffle)
+    player.repeat_track.assert_called_once_with(repeat)
 
 
 def test_device_transfer(session):
@@ -73,6 +85,15 @@ def test_device_not_found(session):
         session.run('device "Garage"')
 
 
+def test_device_lookup_reuses_index(session):
+    player = session._mocks["Player"].return_value
+    devices = PropertyMock(return_value=player.device_ids)
+    type(player).device_ids = devices
+    session.run('device "Den"')
+    session.run('device "den"')
+    assert devices.call_count == 1
+
+
 # ── Queries ─────────────────────────────────────────────────────────
 
 
@@ -85,6 +106,15 @@ def test_search(session):
     assert r["kind"] == "track"
 
 
+def test_search_multiple_terms_keeps_order(session):
+    def query_songs(term, limit=10, offset=0):
+        return {"data": {"searchV2": {"tracksV2": {"items": [term]}}}}
+
+    session._mocks["Song"].return_value.query_songs.side_effect = query_songs
+    r = session.run('search track "a" "b" "c"')
+    assert r["data"] == ["a", "b", "c"]
+
+
 # ── Error handling ──────────────────────────────────────────────────
 
 
@@ -101,8 +131,9 @@ def test_unknown_action(session):
 def test_exception_wraps_as_dsl_error(session):
     player = session._mocks["Player"].return_value
     player.pause.side_effect = RuntimeError("connection lost")
-    with pytest.raises(DSLError, match="connection lost"):
+    with pytest.raises(DSLError, match="connection lost") as exc_info:
         session.run("pause")
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
 
 
 # ── WebSocket reconnect ────────────────────────────────────────────
@@ -110,18 +141,10 @@ def test_exception_wraps_as_dsl_error(session):
 
 def test_ws_error_retries_and_succeeds(session):
     player = session._mocks["Player"].return_value
-    call_count = 0
-
-    def pause_side_effect():
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            raise WebSocketError("disconnected")
-
-    player.pause.side_effect = pause_side_effect
+    player.pause.side_effect = [WebSocketError("disconnected"), None]
     r = session.run("pause")
     assert r["status"] == "ok"
-    assert call_count == 2  # first failed, second succeeded
+    assert player.pause.call_count == 2  # first failed, second succeeded
 
 
 def test_ws_error_both_attempts_raises(session):
@@ -138,12 +161,32 @@ def test_non_ws_error_no_retry(session):
         session.run("pause")
 
 
+# ── Health check ────────────────────────────────────────────────────
+
+
+def test_health_check_reuses_base_client(session):
+    assert session.health_check() == {"status": "ok", "authenticated": True}
+    assert session.health_check()["status"] == "ok"
+    session._mocks["BaseClient"].assert_called_once()
+    assert session._mocks["BaseClient"].return_value._get_auth_vars.call_count == 2
+
+
+def test_health_check_reports_error(session):
+    session._mocks["BaseClient"].return_value._get_auth_vars.side_effect = RuntimeError("401")
+    r = session.health_check()
+    assert r == {"status": "error", "authenticated": False, "error": "401"}
+
+
+def test_close_closes_base_client(session):
+    session.health_check()
+    session.close()
+    session._mocks["BaseClient"].return_value.close.assert_called_once()
+
+
 # ── Session setup ───────────────────────────────────────────────────
 
 
 def test_setup_creates_file(tmp_path):
-    import json
-
     dest = tmp_path / "session.json"
     SpotifySession.setup("FAKE_SP_DC", path=dest)
     assert dest.exists()
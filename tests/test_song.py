@@ -0,0 +1,77 @@
+"""Song tests: batched playlist writes and cache invalidation.
+
+The HTTP client is a mock; requests are inspected instead of sent.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from clautify.exceptions import SongError
+from clautify.http.data import Response
+from clautify.http.request import TLSClient
+from clautify.playlist import PrivatePlaylist, PublicPlaylist
+from clautify.song import Song
+
+_PLAYLIST_URI = "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M"
+
+
+def _response(status_code):
+    return Response(raw=MagicMock(), status_code=status_code, response={})
+
+
+@pytest.fixture
+def song():
+    http = MagicMock()
+    http.client_identifier = "chrome_120"
+    playlist = Mock(spec=PrivatePlaylist)
+    playlist.playlist_uri = _PLAYLIST_URI
+    playlist.login.client = http
+    s = Song(playlist)
+    s.base._hash_map = {"addToPlaylist": "a" * 64}
+    return s
+
+
+# ── Batched adds ────────────────────────────────────────────────────
+
+
+def test_adds_are_sent_in_batches(song):
+    song.base.client.post.return_value = _response(200)
+    song.add_songs_to_playlist([f"{i:022d}" for i in range(250)])
+    sizes = [len(c.kwargs["json"]["variables"]["uris"]) for c in song.base.client.post.call_args_list]
+    assert sizes == [100, 100, 50]
+    song.base.client.response_cache.invalidate.assert_called_once_with(_PLAYLIST_URI)
+
+
+def test_failed_batch_still_invalidates_the_playlist(song):
+    song.base.client.post.side_effect = [_response(200), _response(500), _response(200)]
+    with pytest.raises(SongError, match="Could not add songs"):
+        song.add_songs_to_playlist([f"{i:022d}" for i in range(250)])
+    # The first batch landed, so cached pages of the playlist are stale
+    assert song.base.client.post.call_count == 2
+    song.base.client.response_cache.invalidate.assert_called_once_with(_PLAYLIST_URI)
+
+
+# ── Invalidation ────────────────────────────────────────────────────
+
+
+def test_invalidation_reaches_public_readers(song, monkeypatch):
+    writer = TLSClient("chrome_120", "")
+    monkeypatch.setattr(song.base, "client", writer)
+    reader = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M").base.client
+    assert reader.response_cache is writer.response_cache
+
+    cache = reader.response_cache
+    key = cache.key("POST", "https://api-partner.spotify.com/pathfinder/v1/query", {"params": {"uri": _PLAYLIST_URI}})
+    raw = MagicMock()
+    raw.headers = {"Cache-Control": "max-age=60"}
+    cache.store(key, Response(raw=raw, status_code=200, response={"items": []}))
+    song._invalidate_playlist()
+    assert cache.lookup(key) == (None, None)
+    writer.close()
+
+
+def test_invalidation_without_playlist_raises(song):
+    song.playlist = None
+    with pytest.raises(ValueError, match="Playlist not set"):
+        song._invalidate_playlist()
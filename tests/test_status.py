@@ -0,0 +1,78 @@
+"""PlayerStatus tests: slot layout and state caching.
+
+Instances are built with object.__new__ so no websocket is opened.
+"""
+
+import pytest
+
+from clautify.player import Player
+from clautify.status import PlayerStatus
+from clautify.websocket import WebsocketStreamer
+
+_DUMP = {
+    "player_state": {"is_playing": True},
+    "devices": {},
+    "active_device_id": "dev0",
+}
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = []
+
+    def connect_device(self):
+        calls.append(self)
+        return _DUMP
+
+    monkeypatch.setattr(PlayerStatus, "connect_device", connect_device)
+    return calls
+
+
+@pytest.fixture
+def status(fetches):
+    s = object.__new__(PlayerStatus)
+    s.state_max_age = 60.0
+    s._device_dump = None
+    s._state = None
+    s._devices = None
+    s._state_fetched_at = None
+    s._saved_state = None
+    s._saved_device_ids = None
+    return s
+
+
+# ── Slots ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("cls", [WebsocketStreamer, PlayerStatus, Player])
+def test_every_class_in_the_chain_declares_slots(cls):
+    for klass in cls.__mro__[:-1]:
+        assert "__slots__" in vars(klass), klass.__name__
+    assert not hasattr(object.__new__(cls), "__dict__")
+
+
+# ── State caching ───────────────────────────────────────────────────
+
+
+def test_saved_state_is_computed_once(status, fetches):
+    first = status.saved_state
+    status.refresh_state()
+    assert status.saved_state is first
+    assert first.is_playing is True
+    assert len(fetches) == 2
+
+
+def test_saved_device_ids_are_computed_once(status, fetches):
+    first = status.saved_device_ids
+    assert status.saved_device_ids is first
+    assert first.active_device_id == "dev0"
+    assert len(fetches) == 1
+
+
+def test_state_reuses_a_fresh_fetch(status, fetches):
+    status.state
+    status.device_ids
+    assert len(fetches) == 1
+    status.invalidate_state()
+    status.state
+    assert len(fetches) == 2
@@ -0,0 +1,118 @@
+"""String helper tests: Spotify IDs, JSON string extraction, script links and JS chunk-map parsing."""
+
+import pytest
+
+from clautify.utils import strings
+from clautify.utils.strings import (
+    _parse_chunk_map,
+    extract_js_links,
+    extract_mappings,
+    extract_spotify_id,
+    parse_json_string,
+)
+
+# Trimmed accounts.spotify.com/en/login page: the flow context sits in the inline JSON bootstrap
+_LOGIN_PAGE = (
+    "<!DOCTYPE html><html><head><title>Login - Spotify</title></head><body>"
+    '<div id="root"></div>'
+    '<script id="__NEXT_DATA__" type="application/json">'
+    '{"props":{"pageProps":{"flowCtx":"c1f3a8e2-5d4b-4c8a-9e8f-2b7d6a1c0e9f:1760400000",'
+    '"country":"US","locale":"en","captchaSiteKey":"6LfCVLAUAAAAALFwwRnnCJ12DalriUGbj8FW_J39"}},'
+    '"page":"/[locale]/login","query":{"locale":"en"}}'
+    "</script></body></html>"
+)
+_FLOW_CTX = "c1f3a8e2-5d4b-4c8a-9e8f-2b7d6a1c0e9f:1760400000"
+
+
+# ── extract_spotify_id ──────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "identifier, expected",
+    [
+        ("6rqhFgbbKwnb9MLmUQDhG6", "6rqhFgbbKwnb9MLmUQDhG6"),
+        ("spotify:track:6rqhFgbbKwnb9MLmUQDhG6", "6rqhFgbbKwnb9MLmUQDhG6"),
+        ("https://open.spotify.com/track/6rqhFgbbKwnb9MLmUQDhG6?si=abc", "6rqhFgbbKwnb9MLmUQDhG6"),
+    ],
+    ids=["bare", "uri", "url"],
+)
+def test_extract_spotify_id(identifier, expected):
+    assert extract_spotify_id(identifier, "track") == expected
+
+
+# ── parse_json_string ───────────────────────────────────────────────
+
+
+def test_flow_ctx_from_login_page():
+    assert parse_json_string(_LOGIN_PAGE, "flowCtx") == _FLOW_CTX
+
+
+def test_flow_ctx_from_login_page_bytes():
+    assert parse_json_string(_LOGIN_PAGE.encode(), "flowCtx") == _FLOW_CTX.encode()
+
+
+def test_escaped_quote_stays_in_value():
+    assert parse_json_string(r'{"title":"say \"hi\"","x":"y"}', "title") == r"say \"hi\""
+
+
+def test_key_must_match_whole_name():
+    assert parse_json_string('{"oldflowCtx":"stale","flowCtx":"fresh"}', "flowCtx") == "fresh"
+
+
+def test_missing_key_raises():
+    with pytest.raises(ValueError, match='"flowCtx":" not found'):
+        parse_json_string("<html><body>Something went wrong</body></html>", "flowCtx")
+
+
+# ── Script links ────────────────────────────────────────────────────
+
+# Trimmed open.spotify.com page: external packs, an inline config script and a non-JS src
+_PLAYER_PAGE = (
+    "<!DOCTYPE html><html><head>"
+    '<script src="https://open.spotifycdn.com/cdn/build/web-player/vendor~web-player.5d3a1f.js"></script>'
+    '<script id="appServerConfig" type="text/plain">eyJjbGllbnRWZXJzaW9uIjoiMS4yLjMifQ==</script>'
+    '<link rel="stylesheet" href="https://open.spotifycdn.com/cdn/build/web-player/web-player.css">'
+    "</head><body><div id=main></div>"
+    '<script src="https://open.spotifycdn.com/cdn/build/web-player/web-player.9c2b7e.js" defer></script>'
+    '<script src="https://www.google.com/recaptcha/enterprise.js?render=explicit"></script>'
+    "<script>window.__spotify = {};</script>"
+    "</body></html>"
+)
+_PLAYER_PACKS = [
+    "https://open.spotifycdn.com/cdn/build/web-player/vendor~web-player.5d3a1f.js",
+    "https://open.spotifycdn.com/cdn/build/web-player/web-player.9c2b7e.js",
+]
+
+
+@pytest.fixture(params=["lxml", "bs4"])
+def parser_path(request, monkeypatch):
+    if request.param == "lxml":
+        etree = pytest.importorskip("lxml.etree")
+        monkeypatch.setattr(strings, "etree", etree)
+    else:
+        monkeypatch.setattr(strings, "etree", None)
+    return request.param
+
+
+def test_js_links_from_player_page(parser_path):
+    assert extract_js_links(_PLAYER_PAGE) == _PLAYER_PACKS
+
+
+def test_page_without_scripts(parser_path):
+    assert extract_js_links("<html><body><p>Nothing here</p></body></html>") == []
+
+
+# ── Chunk maps ──────────────────────────────────────────────────────
+
+
+def test_chunk_map_literal_to_dict():
+    assert _parse_chunk_map('{12:"album",340:"track"}') == {12: "album", 340: "track"}
+
+
+def test_digits_inside_a_value_are_not_keys():
+    assert _parse_chunk_map('{1:"a,2:b",3:"{4:c}"}') == {1: "a,2:b", 3: "{4:c}"}
+
+
+def test_extract_mappings_reads_fourth_and_fifth_literals():
+    pack = '{0:"x"}' * 3 + '{1:"album",2:"x,9:y"}{1:"h1",2:"h2"}'
+    assert extract_mappings(pack) == ({1: "album", 2: "x,9:y"}, {1: "h1", 2: "h2"})